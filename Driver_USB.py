@@ -5,27 +5,63 @@ Este módulo contiene los componentes principales para simular dispositivos de E
 controladores de dispositivos, manejo de interrupciones y planificación de operaciones.
 """
 
+import sys
 import time
 import random
+import bisect
 import threading
 import logging
-from queue import Queue, PriorityQueue
-import uuid
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+try:
+    import numba  # Opcional: compila el núcleo numérico de los lotes de bloques
+except ImportError:
+    numba = None
+from queue import SimpleQueue
+import heapq
+from collections import deque
+import itertools
+from types import MappingProxyType
 from enum import Enum, auto
-from typing import Dict, List, Tuple, Any, Optional, Callable
+from typing import Dict, List, Tuple, Any, Optional, Callable, Iterable, Mapping, NamedTuple
 
-# Configurar el registro
+# Configurar el registro: los registros se encolan y un hilo en segundo plano
+# los escribe en el archivo y la consola, para no bloquear las operaciones de E/S
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler("io_simulation.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = SimpleQueue()
+log_listener = QueueListener(_log_queue, *_log_handlers)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("io_simulation.log"),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
+log_listener.start()
+_log_listener_running = True
+
+def stop_log_listener():
+    """Detener el hilo de registro tras escribir los mensajes pendientes (las llamadas repetidas no hacen nada)"""
+    global _log_listener_running
+    if _log_listener_running:
+        _log_listener_running = False
+        log_listener.stop()
+
+atexit.register(stop_log_listener)
 
 logger = logging.getLogger("SimulaciónE/S")
 
+# Generador de IDs de operación: un entero creciente es suficiente como clave interna
+_op_id_counter = itertools.count(1).__next__
+
+# Funciones del camino crítico enlazadas una sola vez
+_rand = random.random
+_now = time.time
+_mono = time.monotonic_ns
+
 # =============================================================================
 # ENUMS Y CONSTANTES
 # =============================================================================
@@ -48,10 +84,67 @@ class DeviceStatus(Enum):
     EN_ESPERA = auto()
 
 class SchedulingAlgorithm(Enum):
+    """
+    Algoritmos de planificación de las colas por dispositivo.
+    PASSTHROUGH no despacha directamente: las operaciones siguen encolándose en una deque FIFO
+    por dispositivo, pero el único consumidor (el Gestor de E/S) las extrae sin tomar el cerrojo.
+    """
     FIFO = auto()
     PRIORIDAD = auto()
     TRABAJO_MAS_CORTO_PRIMERO = auto()
     ROUND_ROBIN = auto()
+    PASSTHROUGH = auto()  # Sin planificación propia: FIFO que el consumidor vacía sin cerrojo
+
+# Nombres de los tipos de operación, resueltos una sola vez
+_OP_TYPE_NAME = {operation_type: operation_type.name for operation_type in OperationType}
+
+# Codificación compacta del estado de una operación para el historial columnar
+OPERATION_STATUS_CODES = {"PENDIENTE": 0, "EN_PROGRESO": 1, "COMPLETADA": 2, "FALLIDA": 3}
+OPERATION_STATUS_NAMES = {code: name for name, code in OPERATION_STATUS_CODES.items()}
+
+HISTORY_INITIAL_CAPACITY = 1024
+DRIVER_HISTORY_MAXLEN = 10_000  # Tope del historial columnar de cada controlador; después se sobrescribe lo más antiguo
+OPERATION_HISTORY_MAXLEN = 10_000
+INTERRUPT_HISTORY_MAXLEN = 10_000
+INTERRUPT_ARGS_REPR_LIMIT = 64
+
+def _short_repr(value) -> str:
+    """Representación de depuración truncada para el historial de interrupciones"""
+    text = repr(value)
+    return text if len(text) <= INTERRUPT_ARGS_REPR_LIMIT else text[:INTERRUPT_ARGS_REPR_LIMIT - 3] + "..."
+
+# =============================================================================
+# RELOJ DE SIMULACIÓN
+# =============================================================================
+
+# 'realtime' espera el tiempo simulado con time.sleep; 'virtual' solo avanza un
+# reloj lógico, de modo que las simulaciones por lotes no esperan tiempo real
+SIMULATION_MODE = 'realtime'
+
+class VirtualClock:
+    """
+    Reloj lógico compartido por todos los controladores en el modo de simulación virtual.
+    """
+    t = 0.0
+    lock = threading.Lock()
+    
+    @classmethod
+    def advance(cls, seconds: float):
+        """Avanzar el reloj virtual"""
+        with cls.lock:
+            cls.t += seconds
+
+def now() -> float:
+    """Obtener la hora de la simulación: reloj de pared o reloj virtual según SIMULATION_MODE"""
+    if SIMULATION_MODE == 'virtual':
+        return VirtualClock.t
+    return _now()
+
+def now_ns() -> int:
+    """Obtener un instante monotónico en nanosegundos para medir duraciones"""
+    if SIMULATION_MODE == 'virtual':
+        return round(VirtualClock.t * 1e9)
+    return _mono()
 
 # =============================================================================
 # ESTRUCTURAS DE DATOS
@@ -62,6 +155,10 @@ class DeviceControlBlock:
     Simula el Bloque de Control de Dispositivos (DCB) que contiene metadatos sobre un dispositivo.
     En un sistema operativo real, esto contendría punteros a estructuras de datos específicas del dispositivo.
     """
+    __slots__ = ('device_id', 'device_name', 'device_type', 'capacity_gb', 'transfer_rate_mb_s',
+                 '_status', 'current_position', 'error_count', 'operations_completed',
+                 'bytes_transferred', 'last_op_ns', 'creation_time', 'version')
+    
     def __init__(self, device_id: int, device_name: str, device_type: DeviceType, 
                  capacity_gb: float = 0, transfer_rate_mb_s: float = 0):
         self.device_id = device_id
@@ -69,13 +166,25 @@ class DeviceControlBlock:
         self.device_type = device_type
         self.capacity_gb = capacity_gb
         self.transfer_rate_mb_s = transfer_rate_mb_s
-        self.status = DeviceStatus.DESCONECTADO
+        self.version = 0  # Se incrementa con cada cambio de estado o de contadores
+        self._status = DeviceStatus.DESCONECTADO
         self.current_position = 0  # Para dispositivos de bloques
         self.error_count = 0
         self.operations_completed = 0
         self.bytes_transferred = 0
-        self.last_operation_time = 0
-        self.creation_time = time.time()
+        self.last_op_ns = 0  # Instante monotónico de la última operación completada
+        self.creation_time = now()
+        
+    @property
+    def status(self) -> DeviceStatus:
+        """Estado actual del dispositivo; asignar un estado distinto incrementa la versión"""
+        return self._status
+    
+    @status.setter
+    def status(self, status: DeviceStatus):
+        if status is not self._status:
+            self._status = status
+            self.version += 1
         
     def __str__(self):
         return (f"[DCB] {self.device_name} (ID: {self.device_id}, "
@@ -100,24 +209,34 @@ class IOOperation:
     Representa una operación de E/S en la cola de E/S.
     Contiene el tipo de operación, tamaño de datos, información del proceso y prioridad.
     """
+    __slots__ = ('operation_id', 'operation_type', 'data_size_mb', 'process_name', 'priority',
+                 'block_address', 'creation_time', 'start_time_ns', 'completion_time_ns', 'status',
+                 'neg_priority')
+    
     def __init__(self, operation_type: OperationType, data_size_mb: float, 
                  process_name: str, priority: int = 0, block_address: int = None):
-        self.operation_id = str(uuid.uuid4())[:8]  # Generar ID único
+        self.operation_id = _op_id_counter()  # Generar ID único
         self.operation_type = operation_type
         self.data_size_mb = data_size_mb
         self.process_name = process_name
         self.priority = priority
         self.block_address = block_address  # Para dispositivos de bloques
-        self.creation_time = time.time()
-        self.start_time = None
-        self.completion_time = None
+        self.creation_time = now()
+        self.start_time_ns = None  # Marcas monotónicas (now_ns) para calcular duraciones
+        self.completion_time_ns = None
         self.status = "PENDIENTE"
+        self.neg_priority = -priority  # Clave precalculada para el montículo de prioridad
         
     def __str__(self):
         return (f"[IOOperation] ID: {self.operation_id}, Tipo: {self.operation_type.name}, "
                 f"Tamaño: {self.data_size_mb} MB, Proceso: {self.process_name}, "
                 f"Prioridad: {self.priority}, Estado: {self.status}")
     
+    @property
+    def operation_id_str(self) -> str:
+        """ID de la operación como cadena, para mostrar o serializar"""
+        return str(self.operation_id)
+    
     def __lt__(self, other):
         # Para comparación en cola de prioridad
         return self.priority > other.priority  # Número más alto = mayor prioridad
@@ -127,80 +246,174 @@ class InterruptTable:
     Simula una Tabla de Interrupciones que asigna tipos de interrupciones a funciones manejadoras.
     En un sistema operativo real, esto contendría punteros a rutinas de servicio de interrupciones.
     """
-    def __init__(self):
+    def __init__(self, record_history: bool = False):
         self.interrupt_handlers = {}
-        self.interrupt_history = []
-        self.interrupt_stats = {}
+        self.record_history = record_history  # El historial solo se construye si alguien lo consume
+        self.safe_dispatch = True  # Capturar excepciones de los manejadores; se puede desactivar tras el arranque
+        self.interrupt_history = deque(maxlen=INTERRUPT_HISTORY_MAXLEN)  # Se descartan las más antiguas
+        self._stat_count: Dict[str, int] = {}
+        self._stat_last: Dict[str, Optional[float]] = {}
         
+    @property
+    def interrupt_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Estadísticas por tipo de interrupción con la forma {"count", "last_triggered"}"""
+        return {
+            interrupt_type: {"count": count, "last_triggered": self._stat_last[interrupt_type]}
+            for interrupt_type, count in self._stat_count.items()
+        }
+    
     def register_interrupt_handler(self, interrupt_type: str, handler: Callable):
         """Registrar una función manejadora para un tipo específico de interrupción"""
+        interrupt_type = sys.intern(interrupt_type)
         self.interrupt_handlers[interrupt_type] = handler
-        self.interrupt_stats[interrupt_type] = {
-            "count": 0,
-            "last_triggered": None
-        }
+        self._stat_count[interrupt_type] = 0
+        self._stat_last[interrupt_type] = None
         logger.info(f"Manejador registrado para interrupción: {interrupt_type}")
         
     def trigger_interrupt(self, interrupt_type: str, *args, **kwargs):
         """Activar una interrupción llamando a su función manejadora"""
-        logger.info(f"Interrupción activada: {interrupt_type}")
+        logger.info("Interrupción activada: %s", interrupt_type)
+        
+        t = now()
         
         # Registrar interrupción en el historial
-        interrupt_info = {
-            "type": interrupt_type,
-            "time": time.time(),
-            "args": args,
-            "kwargs": kwargs
-        }
-        self.interrupt_history.append(interrupt_info)
+        if self.record_history:
+            self.interrupt_history.append({
+                "type": interrupt_type,
+                "time": t,
+                "args": _short_repr(args) if args else "",
+                "kwargs": _short_repr(kwargs) if kwargs else ""
+            })
         
-        # Actualizar estadísticas
-        if interrupt_type in self.interrupt_stats:
-            self.interrupt_stats[interrupt_type]["count"] += 1
-            self.interrupt_stats[interrupt_type]["last_triggered"] = time.time()
+        # Actualizar estadísticas (preasignadas en register_interrupt_handler)
+        if interrupt_type in self._stat_count:
+            self._stat_count[interrupt_type] += 1
+            self._stat_last[interrupt_type] = t
         
         # Llamar al manejador si está registrado
-        if interrupt_type in self.interrupt_handlers:
+        handler = self.interrupt_handlers.get(interrupt_type)
+        if handler is None:
+            logger.warning("No hay manejador registrado para la interrupción: %s", interrupt_type)
+            return
+        if self.safe_dispatch:
             try:
-                self.interrupt_handlers[interrupt_type](*args, **kwargs)
+                handler(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error en el manejador de interrupción para {interrupt_type}: {e}")
+                logger.error("Error en el manejador de interrupción para %s: %s", interrupt_type, e)
         else:
-            logger.warning(f"No hay manejador registrado para la interrupción: {interrupt_type}")
+            handler(*args, **kwargs)
+    
+    def trigger_many(self, interrupt_types: Iterable[str]):
+        """Activar varias interrupciones sin argumentos en orden, con una sola lectura del reloj"""
+        t = now()
+        handlers = self.interrupt_handlers
+        stat_count = self._stat_count
+        stat_last = self._stat_last
+        
+        for interrupt_type in interrupt_types:
+            logger.info("Interrupción activada: %s", interrupt_type)
+            if self.record_history:
+                self.interrupt_history.append({"type": interrupt_type, "time": t, "args": "", "kwargs": ""})
+            if interrupt_type in stat_count:
+                stat_count[interrupt_type] += 1
+                stat_last[interrupt_type] = t
+            
+            handler = handlers.get(interrupt_type)
+            if handler is None:
+                logger.warning("No hay manejador registrado para la interrupción: %s", interrupt_type)
+                continue
+            if self.safe_dispatch:
+                try:
+                    handler()
+                except Exception as e:
+                    logger.error("Error en el manejador de interrupción para %s: %s", interrupt_type, e)
+            else:
+                handler()
 
 class Buffer:
     """
     Simula un búfer de memoria para operaciones de E/S.
     En un sistema operativo real, esto sería una región de memoria para almacenamiento temporal de datos.
     """
+    __slots__ = ('size_kb', 'used_kb', 'data')
+    
     def __init__(self, size_kb: int):
         self.size_kb = size_kb
         self.used_kb = 0
-        self.data = {}  # Almacenamiento de datos simulado
+        self.data: Dict[int, int] = {}  # Tamaño asignado por operación
         
-    def allocate(self, size_kb: int, operation_id: str) -> bool:
+    def allocate(self, size_kb: int, operation_id: int) -> bool:
         """Intentar asignar espacio de búfer para una operación"""
         if self.used_kb + size_kb <= self.size_kb:
             self.used_kb += size_kb
-            self.data[operation_id] = {
-                "size": size_kb,
-                "content": f"Datos simulados para la operación {operation_id}"
-            }
+            self.data[operation_id] = size_kb
             return True
         return False
     
-    def release(self, operation_id: str) -> bool:
+    def release(self, operation_id: int) -> bool:
         """Liberar espacio de búfer asignado para una operación"""
-        if operation_id in self.data:
-            self.used_kb -= self.data[operation_id]["size"]
-            del self.data[operation_id]
-            return True
-        return False
+        size_kb = self.data.pop(operation_id, None)
+        if size_kb is None:
+            return False
+        self.used_kb -= size_kb
+        return True
+    
+    def get_content(self, operation_id: int) -> str:
+        """Contenido simulado de una operación, generado solo cuando se solicita"""
+        return f"Datos simulados para la operación {operation_id}"
     
     def get_usage_percentage(self) -> float:
         """Devolver el porcentaje de espacio de búfer actualmente en uso"""
         return (self.used_kb / self.size_kb) * 100 if self.size_kb > 0 else 0
 
+# =============================================================================
+# NÚCLEO NUMÉRICO DE LOTES
+# =============================================================================
+
+def _run_block_batch_numpy(sizes, addresses, moves, allocated, draws, current_position, rate, error_probability):
+    """
+    Calcular duraciones, errores y posiciones del cabezal para un lote de bloques.
+    Devuelve (duraciones, errores, posiciones) con una entrada por operación.
+    """
+    n = sizes.shape[0]
+    # Posición del cabezal tras cada operación: las que no se mueven conservan la anterior
+    last_moved = np.maximum.accumulate(np.where(moves, np.arange(n), -1))
+    positions = np.where(last_moved >= 0, addresses[last_moved], current_position)
+    previous = np.concatenate(([current_position], positions[:-1]))
+    seek_times = np.abs(positions - previous) * 0.001  # 1ms por cada 1000 bloques
+    
+    transfer_times = sizes / rate
+    errors = (draws < error_probability) & allocated
+    durations = np.where(allocated, seek_times + np.where(errors, transfer_times / 3, transfer_times), 0.0)
+    return durations, errors, positions
+
+def _run_block_batch_loop(sizes, addresses, moves, allocated, draws, current_position, rate, error_probability):
+    """Versión en bucle de _run_block_batch_numpy, pensada para compilarse con Numba"""
+    n = sizes.shape[0]
+    durations = np.zeros(n, dtype=np.float64)
+    errors = np.zeros(n, dtype=np.bool_)
+    positions = np.empty(n, dtype=np.int64)
+    position = current_position
+    for i in range(n):
+        if moves[i]:
+            seek_time = abs(addresses[i] - position) * 0.001
+            position = addresses[i]
+        else:
+            seek_time = 0.0
+        positions[i] = position
+        if allocated[i]:
+            transfer_time = sizes[i] / rate
+            if draws[i] < error_probability:
+                errors[i] = True
+                transfer_time /= 3
+            durations[i] = seek_time + transfer_time
+    return durations, errors, positions
+
+if numba is not None:
+    _run_block_batch = numba.njit(cache=True)(_run_block_batch_loop)
+else:
+    _run_block_batch = _run_block_batch_numpy
+
 # =============================================================================
 # CONTROLADORES DE DISPOSITIVOS
 # =============================================================================
@@ -209,69 +422,202 @@ class DeviceDriver:
     """
     Clase base para controladores de dispositivos. Maneja la funcionalidad común para todos los tipos de dispositivos.
     """
+    # Estados usados en el camino crítico, resueltos una sola vez
+    _S_BUSY = DeviceStatus.OCUPADO
+    _S_CONN = DeviceStatus.CONECTADO
+    _S_ERR = DeviceStatus.ERROR
+    
     def __init__(self, device_control_block: DeviceControlBlock, 
                  interrupt_table: InterruptTable, buffer_manager: 'BufferManager'):
         self.dcb = device_control_block
         self.interrupt_table = interrupt_table
         self.buffer_manager = buffer_manager
-        self.operation_history = []
+        self._claim_lock = threading.Lock()  # Protege la transición CONECTADO -> OCUPADO
+        
+        # Nombres de interrupción del dispositivo, calculados una sola vez e internados
+        self.interrupt_key = sys.intern(self.dcb.device_name.upper().replace(' ', '_'))
+        self.connect_event = sys.intern(f"{self.interrupt_key}_CONNECT")
+        self.disconnect_event = sys.intern(f"{self.interrupt_key}_DISCONNECT")
+        self.error_event = sys.intern(f"{self.interrupt_key}_ERROR")
+        self.data_available_event = sys.intern(f"{self.interrupt_key}_DATA_AVAILABLE")
+        self.completed_event = sys.intern(f"{self.interrupt_key}_OPERATION_COMPLETED")
+        
+        # Historial de operaciones en formato columnar: una matriz por campo numérico. Crece hasta
+        # DRIVER_HISTORY_MAXLEN y después funciona como anillo (índice de escritura = total % capacidad)
+        self._hist_len = 0  # Total de operaciones registradas
+        self._hist_start = np.empty(HISTORY_INITIAL_CAPACITY, dtype=np.int64)  # ns monotónicos, -1 = sin iniciar
+        self._hist_completion = np.empty(HISTORY_INITIAL_CAPACITY, dtype=np.int64)
+        self._hist_size = np.empty(HISTORY_INITIAL_CAPACITY, dtype=np.float64)
+        self._hist_priority = np.empty(HISTORY_INITIAL_CAPACITY, dtype=np.int32)
+        self._hist_status = np.empty(HISTORY_INITIAL_CAPACITY, dtype=np.int8)
+        self._hist_process = []  # Única columna no numérica
+        
+    def _record_history(self, io_operation: IOOperation):
+        """Agregar una operación terminada al historial columnar"""
+        n = self._hist_len
+        capacity = len(self._hist_start)
+        if n == capacity and capacity < DRIVER_HISTORY_MAXLEN:
+            # Crecimiento geométrico de todas las columnas hasta el tope (aún no se ha dado la vuelta)
+            capacity = min(2 * capacity, DRIVER_HISTORY_MAXLEN)
+            self._hist_start = np.resize(self._hist_start, capacity)
+            self._hist_completion = np.resize(self._hist_completion, capacity)
+            self._hist_size = np.resize(self._hist_size, capacity)
+            self._hist_priority = np.resize(self._hist_priority, capacity)
+            self._hist_status = np.resize(self._hist_status, capacity)
+        
+        i = n % capacity
+        start_time_ns = io_operation.start_time_ns
+        self._hist_start[i] = -1 if start_time_ns is None else start_time_ns
+        self._hist_completion[i] = io_operation.completion_time_ns
+        self._hist_size[i] = io_operation.data_size_mb
+        self._hist_priority[i] = io_operation.priority
+        self._hist_status[i] = OPERATION_STATUS_CODES[io_operation.status]
+        if n < capacity:
+            self._hist_process.append(io_operation.process_name)
+        else:
+            self._hist_process[i] = io_operation.process_name
+        self._hist_len = n + 1
+    
+    def get_operation_history(self) -> List[Dict[str, Any]]:
+        """Reconstruir el historial conservado del controlador, del más antiguo al más reciente"""
+        n = self._hist_len
+        capacity = len(self._hist_start)
+        if n <= capacity:
+            order = slice(0, n)
+            processes = self._hist_process
+        else:
+            # El anillo ya dio la vuelta: lo más antiguo empieza en el índice de escritura
+            i = n % capacity
+            order = np.r_[i:capacity, 0:i]
+            processes = self._hist_process[i:] + self._hist_process[:i]
+        return [
+            {
+                "start_time_ns": None if start < 0 else start,
+                "completion_time_ns": completion,
+                "data_size_mb": size,
+                "priority": priority,
+                "status": OPERATION_STATUS_NAMES[status],
+                "process_name": process
+            }
+            for start, completion, size, priority, status, process in zip(
+                self._hist_start[order].tolist(), self._hist_completion[order].tolist(),
+                self._hist_size[order].tolist(), self._hist_priority[order].tolist(),
+                self._hist_status[order].tolist(), processes)
+        ]
+    
+    def get_history_summary(self) -> Dict[str, float]:
+        """Calcular estadísticas agregadas del historial conservado con operaciones vectorizadas"""
+        n = min(self._hist_len, len(self._hist_start))  # El orden no importa para agregar
+        completed = self._hist_status[:n] == OPERATION_STATUS_CODES["COMPLETADA"]
+        durations = self._hist_completion[:n][completed] - self._hist_start[:n][completed]
+        return {
+            "operations": n,
+            "completed": int(np.count_nonzero(completed)),
+            "failed": int(n - np.count_nonzero(completed)),
+            "data_mb": float(self._hist_size[:n][completed].sum()),
+            "average_duration_s": float(durations.mean()) / 1e9 if durations.size else 0.0
+        }
         
-    def perform_operation(self, io_operation: IOOperation) -> bool:
-        """Método base para realizar operaciones de E/S"""
-        if self.dcb.status != DeviceStatus.CONECTADO:
-            logger.error(f"Dispositivo {self.dcb.device_name} no conectado o en estado de error")
+    def _wait(self, seconds: float):
+        """Simular la duración de una operación según el modo de simulación"""
+        if SIMULATION_MODE == 'virtual':
+            VirtualClock.advance(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def try_claim(self) -> bool:
+        """Reservar el dispositivo si está libre: compara y cambia CONECTADO -> OCUPADO de forma atómica"""
+        with self._claim_lock:
+            if self.dcb.status == self._S_CONN:
+                self.dcb.status = self._S_BUSY
+                return True
+            return False
+    
+    def release_claim(self):
+        """Liberar una reserva obtenida con try_claim sin haber realizado operaciones"""
+        with self._claim_lock:
+            if self.dcb.status == self._S_BUSY:
+                self.dcb.status = self._S_CONN
+    
+    def perform_operation(self, io_operation: IOOperation, claimed: bool = False) -> bool:
+        """Método base para realizar operaciones de E/S; reserva el dispositivo si el llamador no lo hizo"""
+        if not claimed and not self.try_claim():
+            logger.error("Dispositivo %s no conectado, ocupado o en estado de error", self.dcb.device_name)
             return False
         
         # Marcar operación como iniciada
-        io_operation.start_time = time.time()
+        io_operation.start_time_ns = now_ns()
         io_operation.status = "EN_PROGRESO"
         
-        # Registrar operación en el historial
-        self.operation_history.append(io_operation)
-        
         return True
     
-    def complete_operation(self, io_operation: IOOperation, success: bool = True):
+    def perform_batch(self, operations: List[IOOperation], claimed: bool = False) -> List[Optional[bool]]:
+        """
+        Realizar varias operaciones seguidas; los controladores pueden especializarlo.
+        Devuelve un resultado por operación: None indica que no llegó a ejecutarse porque
+        el dispositivo dejó de estar disponible, y el llamador debe devolverla a la cola.
+        """
+        if not operations:
+            if claimed:
+                self.release_claim()
+            return []
+        # Cada operación libera el dispositivo al terminar, así que las siguientes lo vuelven a reservar
+        results = []
+        for i, op in enumerate(operations):
+            if (i or not claimed) and not self.try_claim():
+                results.extend([None] * (len(operations) - i))
+                break
+            results.append(self.perform_operation(op, claimed=True))
+        return results
+    
+    def complete_operation(self, io_operation: IOOperation, success: bool = True,
+                           completion_time_ns: Optional[int] = None):
         """Marcar una operación como completada"""
-        io_operation.completion_time = time.time()
+        if completion_time_ns is None:
+            completion_time_ns = now_ns()
+        io_operation.completion_time_ns = completion_time_ns
         io_operation.status = "COMPLETADA" if success else "FALLIDA"
         
         if success:
             self.dcb.operations_completed += 1
             self.dcb.bytes_transferred += io_operation.data_size_mb * 1024 * 1024  # Convertir MB a bytes
-            self.dcb.last_operation_time = time.time()
+            self.dcb.last_op_ns = completion_time_ns
         else:
             self.dcb.error_count += 1
+        self.dcb.version += 1
+        
+        # Registrar operación en el historial
+        self._record_history(io_operation)
             
         # Liberar cualquier búfer asignado
         self.buffer_manager.release_buffer(io_operation.operation_id)
         
         # Activar interrupción de finalización
-        interrupt_type = f"{self.dcb.device_name.upper().replace(' ', '_')}_OPERATION_COMPLETED"
-        self.interrupt_table.trigger_interrupt(interrupt_type, io_operation, success)
+        self.interrupt_table.trigger_interrupt(self.completed_event, io_operation, success)
 
 class BlockDeviceDriver(DeviceDriver):
     """
     Controlador para dispositivos de bloques como discos, unidades USB, etc.
     Maneja operaciones orientadas a bloques con capacidades de búsqueda.
     """
+    ERROR_PROBABILITY = 0.05
+    
     def __init__(self, device_control_block: DeviceControlBlock, 
                  interrupt_table: InterruptTable, buffer_manager: 'BufferManager'):
         super().__init__(device_control_block, interrupt_table, buffer_manager)
         
         # Registrar manejadores de interrupciones específicos del dispositivo
-        device_name_upper = self.dcb.device_name.upper().replace(' ', '_')
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_CONNECT", self.on_connect)  # Revertido a CONNECT
+            self.connect_event, self.on_connect)  # Revertido a CONNECT
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_DISCONNECT", self.on_disconnect)  # Revertido a DISCONNECT
+            self.disconnect_event, self.on_disconnect)  # Revertido a DISCONNECT
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_ERROR", self.on_error)
+            self.error_event, self.on_error)
     
     def on_connect(self):
         """Manejador para interrupción de conexión de dispositivo"""
         logger.info(f"[{self.dcb.device_name}] Dispositivo conectado")
-        self.dcb.status = DeviceStatus.CONECTADO
+        self.dcb.status = self._S_CONN
     
     def on_disconnect(self):
         """Manejador para interrupción de desconexión de dispositivo"""
@@ -281,22 +627,22 @@ class BlockDeviceDriver(DeviceDriver):
     def on_error(self, error_code: int = 0, error_message: str = "Error desconocido"):
         """Manejador para interrupción de error de dispositivo"""
         logger.error(f"[{self.dcb.device_name}] Error de dispositivo: {error_message} (código: {error_code})")
-        self.dcb.status = DeviceStatus.ERROR
+        self.dcb.status = self._S_ERR
         self.dcb.error_count += 1
+        self.dcb.version += 1
     
-    def perform_operation(self, io_operation: IOOperation) -> bool:
+    def perform_operation(self, io_operation: IOOperation, claimed: bool = False) -> bool:
         """Realizar una operación de dispositivo de bloques (lectura/escritura/búsqueda)"""
-        if not super().perform_operation(io_operation):
+        # La clase base deja el dispositivo reservado (OCUPADO)
+        if not super().perform_operation(io_operation, claimed):
             return False
             
         try:
-            # Establecer estado del dispositivo como ocupado
-            self.dcb.status = DeviceStatus.OCUPADO
-            
             # Asignar búfer si es necesario
             if not self.buffer_manager.allocate_buffer(io_operation.data_size_mb, io_operation.operation_id):
-                logger.error(f"Falló la asignación de búfer para la operación {io_operation.operation_id}")
+                logger.error("Falló la asignación de búfer para la operación %s", io_operation.operation_id)
                 self.complete_operation(io_operation, False)
+                self.dcb.status = self._S_CONN  # El dispositivo sigue disponible
                 return False
             
             # Simular búsqueda si se especifica dirección de bloque
@@ -305,37 +651,103 @@ class BlockDeviceDriver(DeviceDriver):
                 seek_distance = abs(self.dcb.current_position - io_operation.block_address)
                 seek_time = seek_distance * 0.001  # Simular tiempo de búsqueda (1ms por cada 1000 bloques)
                 self.dcb.current_position = io_operation.block_address
-                time.sleep(seek_time)
+                self._wait(seek_time)
             
             # Calcular tiempo de transferencia basado en la tasa de transferencia del dispositivo
             transfer_time = io_operation.data_size_mb / self.dcb.transfer_rate_mb_s
             
             # Simular el tiempo de operación
-            logger.info(f"[{self.dcb.device_name}] Operación de {io_operation.operation_type.name} iniciada: "
-                       f"{io_operation.data_size_mb} MB, tiempo estimado: {transfer_time:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] Operación de %s iniciada: %s MB, tiempo estimado: %.2fs",
+                            self.dcb.device_name, io_operation.operation_type.name,
+                            io_operation.data_size_mb, transfer_time)
             
             # Simular errores potenciales (5% de probabilidad)
-            if random.random() < 0.05:
-                time.sleep(transfer_time / 3)  # Operación parcial antes del error
+            if _rand() < self.ERROR_PROBABILITY:
+                self._wait(transfer_time / 3)  # Operación parcial antes del error
                 raise IOError("Error de E/S simulado")
                 
-            time.sleep(transfer_time)
+            self._wait(transfer_time)
             
-            logger.info(f"[{self.dcb.device_name}] Operación completada exitosamente")
+            logger.info("[%s] Operación completada exitosamente", self.dcb.device_name)
             
             # Marcar operación como completada
             self.complete_operation(io_operation, True)
             
             # Establecer estado del dispositivo como conectado
-            self.dcb.status = DeviceStatus.CONECTADO
+            self.dcb.status = self._S_CONN
             
             return True
             
         except Exception as e:
-            logger.error(f"[{self.dcb.device_name}] Operación fallida: {e}")
+            logger.error("[%s] Operación fallida: %s", self.dcb.device_name, e)
             self.complete_operation(io_operation, False)
-            self.dcb.status = DeviceStatus.ERROR
+            self.dcb.status = self._S_ERR
             return False
+    
+    def perform_batch(self, operations: List[IOOperation], claimed: bool = False) -> List[Optional[bool]]:
+        """
+        Realizar un lote de operaciones de bloques consecutivas.
+        
+        Los tiempos de búsqueda y transferencia y los errores simulados se calculan
+        para todo el lote con _run_block_batch (Numba si está instalado, NumPy si no)
+        y se espera una sola vez por la duración total.
+        Los búferes de todo el lote se reservan al enviarlo, como en una cola de envío
+        por lotes. Un error deja el dispositivo en estado de error, así que las
+        operaciones posteriores del lote no se ejecutan y se devuelven como None
+        para que el llamador las vuelva a encolar.
+        """
+        n = len(operations)
+        results = [None] * n
+        if not n:
+            if claimed:
+                self.release_claim()
+            return results
+        if not claimed and not self.try_claim():
+            logger.error("Dispositivo %s no conectado, ocupado o en estado de error", self.dcb.device_name)
+            return results
+        
+        start_ns = now_ns()
+        
+        sizes = np.fromiter((op.data_size_mb for op in operations), dtype=np.float64, count=n)
+        has_address = np.fromiter((op.block_address is not None for op in operations), dtype=bool, count=n)
+        addresses = np.fromiter((op.block_address or 0 for op in operations), dtype=np.int64, count=n)
+        allocated = np.fromiter(
+            (self.buffer_manager.allocate_buffer(op.data_size_mb, op.operation_id) for op in operations),
+            dtype=bool, count=n)
+        
+        durations, errors, positions = _run_block_batch(
+            sizes, addresses, has_address & allocated, allocated, np.random.random(n),
+            self.dcb.current_position, self.dcb.transfer_rate_mb_s, self.ERROR_PROBABILITY)
+        
+        processed = int(np.argmax(errors)) + 1 if errors.any() else n
+        offsets = np.cumsum(durations[:processed])
+        total = float(offsets[-1])
+        ends = start_ns + np.rint(offsets * 1e9).astype(np.int64)
+        starts = np.concatenate(([start_ns], ends[:-1]))
+        
+        logger.info("[%s] Lote de %d operaciones iniciado, tiempo estimado: %.2fs",
+                    self.dcb.device_name, processed, total)
+        self._wait(total)
+        
+        self.dcb.current_position = int(positions[processed - 1])
+        for i, (op, ok, failed) in enumerate(zip(operations[:processed], allocated.tolist(), errors.tolist())):
+            op.start_time_ns = int(starts[i])
+            if not ok:
+                logger.error("Falló la asignación de búfer para la operación %s", op.operation_id)
+            results[i] = ok and not failed
+            self.complete_operation(op, results[i], completion_time_ns=int(ends[i]))
+        
+        # Liberar los búferes de las operaciones que no llegaron a ejecutarse (se reservarán al reintentarlas)
+        for op in operations[processed:]:
+            self.buffer_manager.release_buffer(op.operation_id)
+        
+        if processed < n or errors[processed - 1]:
+            logger.error("[%s] Operación fallida: Error de E/S simulado", self.dcb.device_name)
+            self.dcb.status = self._S_ERR
+        else:
+            self.dcb.status = self._S_CONN
+        return results
 
 class CharacterDeviceDriver(DeviceDriver):
     """
@@ -347,68 +759,66 @@ class CharacterDeviceDriver(DeviceDriver):
         super().__init__(device_control_block, interrupt_table, buffer_manager)
         
         # Registrar manejadores de interrupciones específicos del dispositivo
-        device_name_upper = self.dcb.device_name.upper().replace(' ', '_')
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_CONNECT", self.on_connect)  # Revertido a CONNECT
+            self.connect_event, self.on_connect)  # Revertido a CONNECT
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_DISCONNECT", self.on_disconnect)  # Revertido a DISCONNECT
+            self.disconnect_event, self.on_disconnect)  # Revertido a DISCONNECT
         self.interrupt_table.register_interrupt_handler(
-            f"{device_name_upper}_DATA_AVAILABLE", self.on_data_available)
+            self.data_available_event, self.on_data_available)
     
     def on_connect(self):
         """Manejador para interrupción de conexión de dispositivo"""
         logger.info(f"[{self.dcb.device_name}] Dispositivo conectado")
-        self.dcb.status = DeviceStatus.CONECTADO
+        self.dcb.status = self._S_CONN
     
     def on_disconnect(self):
         """Manejador para interrupción de desconexión de dispositivo"""
         logger.info(f"[{self.dcb.device_name}] Dispositivo desconectado")
         self.dcb.status = DeviceStatus.DESCONECTADO
-        self.interrupt_table.trigger_interrupt(f"{self.dcb.device_name.upper().replace(' ', '_')}_DISCONNECT")  # Revertido a DISCONNECT
     
     def on_data_available(self, data_size: float = 0):
         """Manejador para interrupción de datos disponibles"""
         logger.info(f"[{self.dcb.device_name}] Datos disponibles: {data_size} MB")
     
-    def perform_operation(self, io_operation: IOOperation) -> bool:
+    def perform_operation(self, io_operation: IOOperation, claimed: bool = False) -> bool:
         """Realizar una operación de dispositivo de caracteres (lectura/escritura)"""
-        if not super().perform_operation(io_operation):
+        # La clase base deja el dispositivo reservado (OCUPADO)
+        if not super().perform_operation(io_operation, claimed):
             return False
             
         try:
-            # Establecer estado del dispositivo como ocupado
-            self.dcb.status = DeviceStatus.OCUPADO
-            
             # Los dispositivos de caracteres no necesitan búsqueda
             # Calcular tiempo de transferencia basado en la tasa de transferencia del dispositivo
             transfer_time = io_operation.data_size_mb / self.dcb.transfer_rate_mb_s
             
             # Simular el tiempo de operación
-            logger.info(f"[{self.dcb.device_name}] Operación de {io_operation.operation_type.name} iniciada: "
-                       f"{io_operation.data_size_mb} MB, tiempo estimado: {transfer_time:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] Operación de %s iniciada: %s MB, tiempo estimado: %.2fs",
+                            self.dcb.device_name, io_operation.operation_type.name,
+                            io_operation.data_size_mb, transfer_time)
             
             # Simular errores potenciales (3% de probabilidad para dispositivos de caracteres)
-            if random.random() < 0.03:
-                time.sleep(transfer_time / 2)  # Operación parcial antes del error
+            if _rand() < 0.03:
+                self._wait(transfer_time / 2)  # Operación parcial antes del error
                 raise IOError("Error de E/S simulado")
                 
-            time.sleep(transfer_time)
+            self._wait(transfer_time)
             
-            logger.info(f"[{self.dcb.device_name}] Operación completada exitosamente")
+            logger.info("[%s] Operación completada exitosamente", self.dcb.device_name)
             
             # Marcar operación como completada
             self.complete_operation(io_operation, True)
             
             # Establecer estado del dispositivo como conectado
-            self.dcb.status = DeviceStatus.CONECTADO
+            self.dcb.status = self._S_CONN
             
             return True
             
         except Exception as e:
-            logger.error(f"[{self.dcb.device_name}] Operación fallida: {e}")
+            logger.error("[%s] Operación fallida: %s", self.dcb.device_name, e)
             self.complete_operation(io_operation, False)
-            self.dcb.status = DeviceStatus.ERROR
-            self.interrupt_table.trigger_interrupt(f"{self.dcb.device_name.upper().replace(' ', '_')}_ERROR", error_code=random.randint(1, 100), error_message="Error simulado")
+            self.dcb.status = self._S_ERR
+            self.interrupt_table.trigger_interrupt(self.error_event, error_code=random.randint(1, 100), error_message="Error simulado")
             return False
 
 # =============================================================================
@@ -420,28 +830,55 @@ class DeviceDriverTable:
     Mantiene un registro de controladores de dispositivos indexados por ID de dispositivo.
     """
     def __init__(self):
-        self.drivers = {}
+        # Los IDs de dispositivo son enteros pequeños y densos: se indexa una lista directamente
+        self.drivers: List[Optional[DeviceDriver]] = []
+        self._drivers_version = 0  # Se incrementa con cada alta o baja de controlador
+        self._names: Dict[int, str] = {}  # device_id -> nombre del dispositivo
+        self._next_id = itertools.count(1)  # Emisión de IDs nuevos sin recorrer la tabla
+        self._all_drivers = (-1, MappingProxyType({}))  # (versión, vista) memorizada de get_all_drivers
+    
+    def alloc_device_id(self) -> int:
+        """Reservar un ID de dispositivo libre; dos llamadas nunca devuelven el mismo ID"""
+        while True:
+            device_id = next(self._next_id)
+            if self.get_driver(device_id) is None:
+                return device_id
     
     def register_driver(self, device_id: int, driver_instance: DeviceDriver):
         """Registrar un controlador para un ID de dispositivo específico"""
+        if device_id < 0:
+            raise ValueError(f"ID de dispositivo inválido: {device_id}")
+        if device_id >= len(self.drivers):
+            self.drivers.extend([None] * (device_id + 1 - len(self.drivers)))
+        self._names[device_id] = driver_instance.dcb.device_name  # Antes que el controlador, para que este nunca se vea sin nombre
         self.drivers[device_id] = driver_instance
+        self._drivers_version += 1
         logger.info(f"Controlador registrado para ID de dispositivo {device_id}: {driver_instance.dcb.device_name}")
     
     def get_driver(self, device_id: int) -> Optional[DeviceDriver]:
         """Obtener la instancia del controlador para un ID de dispositivo específico"""
-        return self.drivers.get(device_id)
+        drivers = self.drivers
+        return drivers[device_id] if 0 <= device_id < len(drivers) else None
     
     def unregister_driver(self, device_id: int) -> bool:
         """Desregistrar un controlador para un ID de dispositivo específico"""
-        if device_id in self.drivers:
-            del self.drivers[device_id]
+        if self.get_driver(device_id) is not None:
+            self.drivers[device_id] = None
+            del self._names[device_id]
+            self._drivers_version += 1
             logger.info(f"Controlador desregistrado para ID de dispositivo {device_id}")
             return True
         return False
     
-    def get_all_drivers(self) -> Dict[int, DeviceDriver]:
-        """Obtener todos los controladores registrados"""
-        return self.drivers
+    def get_all_drivers(self) -> Mapping[int, DeviceDriver]:
+        """Obtener todos los controladores registrados (vista de solo lectura, reconstruida solo tras altas o bajas)"""
+        version, drivers = self._all_drivers
+        if version != self._drivers_version:
+            version = self._drivers_version
+            drivers = MappingProxyType({device_id: driver for device_id, driver in enumerate(self.drivers)
+                                        if driver is not None})
+            self._all_drivers = (version, drivers)
+        return drivers
 
 class BufferManager:
     """
@@ -449,38 +886,108 @@ class BufferManager:
     """
     def __init__(self, total_buffer_size_kb: int = 1024):
         self.total_buffer_size_kb = total_buffer_size_kb
-        self.buffers = {}  # operation_id -> Buffer
+        # Región de memoria preasignada de la que se reparten todos los búferes
+        self.slab = bytearray(total_buffer_size_kb * 1024)
+        # Bloques libres agrupados por ceil(log2(tamaño)), ordenados por dirección
+        self.free_buckets: Dict[int, List[Tuple[int, int]]] = {}
+        self.offset_index: Dict[int, Tuple[int, int, int]] = {}  # fin -> (inicio, tamaño, bucket)
+        self.start_index: Dict[int, Tuple[int, int]] = {}  # inicio -> (tamaño, bucket)
+        self.max_bucket = self._bucket_index(total_buffer_size_kb)
+        self.buffers = {}  # operation_id -> (offset_kb, size_kb)
         self.used_buffer_kb = 0
         
-    def allocate_buffer(self, size_mb: float, operation_id: str) -> bool:
+        if total_buffer_size_kb > 0:
+            self._insert_free(0, total_buffer_size_kb)
+    
+    @staticmethod
+    def _bucket_index(size_kb: int) -> int:
+        """Calcular ceil(log2(size_kb)), el bucket al que pertenece un bloque"""
+        return (size_kb - 1).bit_length() if size_kb > 0 else 0
+    
+    def _insert_free(self, offset: int, size_kb: int):
+        """Agregar un bloque libre a su bucket manteniendo el orden por dirección"""
+        bucket = self._bucket_index(size_kb)
+        bisect.insort(self.free_buckets.setdefault(bucket, []), (offset, size_kb))
+        self.offset_index[offset + size_kb] = (offset, size_kb, bucket)
+        self.start_index[offset] = (size_kb, bucket)
+    
+    def _remove_free(self, offset: int, size_kb: int, bucket: int):
+        """Quitar un bloque libre de su bucket y de los índices de vecinos"""
+        blocks = self.free_buckets[bucket]
+        del blocks[bisect.bisect_left(blocks, (offset, size_kb))]
+        del self.offset_index[offset + size_kb]
+        del self.start_index[offset]
+    
+    def allocate_buffer(self, size_mb: float, operation_id: int) -> bool:
         """Asignar un búfer para una operación de E/S"""
         size_kb = int(size_mb * 1024)
+        if size_kb <= 0:
+            # Las operaciones de menos de 1 KB no ocupan espacio del slab
+            self.buffers[operation_id] = (0, 0)
+            return True
+        
+        # Primer ajuste ordenado por dirección: el bucket exacto puede contener
+        # bloques más pequeños que la petición; cualquier bucket superior sirve
+        bucket = self._bucket_index(size_kb)
+        block = None
+        for b in range(bucket, self.max_bucket + 1):
+            blocks = self.free_buckets.get(b)
+            if not blocks:
+                continue
+            if b == bucket:
+                block = next((blk for blk in blocks if blk[1] >= size_kb), None)
+            else:
+                block = blocks[0]
+            if block is not None:
+                self._remove_free(block[0], block[1], b)
+                break
         
-        # Verificar si tenemos suficiente espacio
-        if self.used_buffer_kb + size_kb > self.total_buffer_size_kb:
-            logger.warning(f"Falló la asignación de búfer: No hay suficiente espacio para {size_kb} KB")
+        if block is None:
+            logger.warning("Falló la asignación de búfer: No hay suficiente espacio para %d KB", size_kb)
             return False
         
-        # Crear un nuevo búfer
-        buffer = Buffer(size_kb)
-        buffer.allocate(size_kb, operation_id)
+        # Dividir el bloque y devolver el sobrante a su bucket
+        offset, block_size = block
+        if block_size > size_kb:
+            self._insert_free(offset + size_kb, block_size - size_kb)
         
-        # Almacenar el búfer
-        self.buffers[operation_id] = buffer
+        self.buffers[operation_id] = (offset, size_kb)
         self.used_buffer_kb += size_kb
         
-        logger.debug(f"Búfer asignado: {size_kb} KB para la operación {operation_id}")
+        logger.debug("Búfer asignado: %d KB en el offset %d KB para la operación %s", size_kb, offset, operation_id)
         return True
     
-    def release_buffer(self, operation_id: str) -> bool:
+    def release_buffer(self, operation_id: int) -> bool:
         """Liberar un búfer asignado para una operación de E/S"""
-        if operation_id in self.buffers:
-            buffer = self.buffers[operation_id]
-            self.used_buffer_kb -= buffer.size_kb
-            del self.buffers[operation_id]
-            logger.debug(f"Búfer liberado para la operación {operation_id}")
-            return True
-        return False
+        region = self.buffers.pop(operation_id, None)
+        if region is None:
+            return False
+        
+        offset, size_kb = region
+        if size_kb:
+            self.used_buffer_kb -= size_kb
+            
+            # Fusionar con el bloque libre anterior y con el siguiente
+            left = self.offset_index.get(offset)
+            if left is not None:
+                self._remove_free(*left)
+                offset, size_kb = left[0], left[1] + size_kb
+            right = self.start_index.get(offset + size_kb)
+            if right is not None:
+                self._remove_free(offset + size_kb, *right)
+                size_kb += right[0]
+            self._insert_free(offset, size_kb)
+        
+        logger.debug("Búfer liberado para la operación %s", operation_id)
+        return True
+    
+    def get_buffer_region(self, operation_id: int) -> Optional[memoryview]:
+        """Obtener una vista sin copia de la región del slab asignada a una operación"""
+        region = self.buffers.get(operation_id)
+        if region is None:
+            return None
+        offset, size_kb = region
+        return memoryview(self.slab)[offset * 1024:(offset + size_kb) * 1024]
     
     def get_buffer_usage(self) -> float:
         """Obtener el porcentaje de espacio de búfer actualmente en uso"""
@@ -494,205 +1001,539 @@ class IOScheduler:
     """
     Implementa diferentes algoritmos de planificación de E/S.
     """
+    # Envejecimiento: cuánto mejora la clave de una operación por cada segundo de espera
+    AGING_SIZE_MB_PER_S = 1.0
+    AGING_PRIORITY_PER_S = 0.5
+    
     def __init__(self, algorithm: SchedulingAlgorithm = SchedulingAlgorithm.FIFO):
         self.algorithm = algorithm
-        self.operation_queues = {}  # device_id -> Queue
+        self.operation_queues = {}  # device_id -> deque (FIFO), o lista usada como montículo (PRIORIDAD y SJF)
+        self._sequence = itertools.count()  # Desempate estable entre operaciones de igual prioridad
+        self._lock = threading.Lock()  # Único cerrojo compartido por productores y el consumidor
+        self._counts: Dict[int, int] = {}  # device_id -> longitud de la cola, legible sin cerrojo
+        
+    def _new_queue(self, algorithm: SchedulingAlgorithm):
+        """Crear el contenedor de cola adecuado para un algoritmo"""
+        if algorithm == SchedulingAlgorithm.PRIORIDAD or algorithm == SchedulingAlgorithm.TRABAJO_MAS_CORTO_PRIMERO:
+            return []  # Montículo de (clave, secuencia, operación) gestionado con heapq
+        return deque()  # FIFO y por defecto
+        
+    def _heap_key(self, io_operation: IOOperation, algorithm: SchedulingAlgorithm, waited: float = 0.0) -> float:
+        """Clave de montículo: PRIORIDAD ordena por -prioridad y SJF por tamaño, ambas rebajadas por la espera"""
+        if algorithm == SchedulingAlgorithm.TRABAJO_MAS_CORTO_PRIMERO:
+            return io_operation.data_size_mb - self.AGING_SIZE_MB_PER_S * waited
+        return io_operation.neg_priority - self.AGING_PRIORITY_PER_S * waited
+        
+    def _push(self, queue, io_operation: IOOperation, algorithm: SchedulingAlgorithm, waited: float = 0.0):
+        """Insertar una operación en un contenedor de cola (waited: segundos ya esperados, para el envejecimiento)"""
+        if isinstance(queue, list):
+            heapq.heappush(queue, (self._heap_key(io_operation, algorithm, waited), next(self._sequence), io_operation))
+        else:
+            queue.append(io_operation)
+            
+    @staticmethod
+    def _drain(queue) -> List[IOOperation]:
+        """Vaciar un contenedor de cola devolviendo sus operaciones en orden de salida"""
+        if isinstance(queue, list):
+            operations = [entry[2] for entry in sorted(queue)]
+            queue.clear()
+            return operations
+        # popleft es atómico: un consumidor sin cerrojo (PASSTHROUGH) nunca obtiene un elemento ya extraído
+        operations = []
+        while True:
+            try:
+                operations.append(queue.popleft())
+            except IndexError:
+                return operations
         
     def set_algorithm(self, algorithm: SchedulingAlgorithm):
         """Cambiar el algoritmo de planificación"""
-        self.algorithm = algorithm
-        
-        # Recrear colas con el nuevo algoritmo
-        new_queues = {}
-        for device_id, old_queue in self.operation_queues.items():
-            # Crear una nueva cola basada en el algoritmo
-            if algorithm == SchedulingAlgorithm.FIFO:
-                new_queue = Queue()
-            elif algorithm == SchedulingAlgorithm.PRIORIDAD:
-                new_queue = PriorityQueue()
-            else:
-                new_queue = Queue()  # Por defecto FIFO
+        with self._lock:
+            self.algorithm = algorithm
+            
+            # Recrear colas con el nuevo algoritmo
+            t = now()
+            new_queues = {}
+            for device_id, old_queue in self.operation_queues.items():
+                new_queue = self._new_queue(algorithm)
                 
-            # Transferir elementos de la cola antigua a la nueva
-            while not old_queue.empty():
-                item = old_queue.get()
-                new_queue.put(item)
+                # Transferir elementos de la cola antigua a la nueva conservando su envejecimiento
+                for item in self._drain(old_queue):
+                    self._push(new_queue, item, algorithm, t - item.creation_time)
+                    
+                new_queues[device_id] = new_queue
                 
-            new_queues[device_id] = new_queue
-            
-        self.operation_queues = new_queues
+            self.operation_queues = new_queues
+            self._counts = {device_id: len(queue) for device_id, queue in new_queues.items()}
         logger.info(f"Algoritmo de planificación cambiado a {algorithm.name}")
     
+    def apply_aging(self):
+        """Recalcular las claves de los montículos según el tiempo de espera para evitar inanición"""
+        t = now()
+        with self._lock:
+            algorithm = self.algorithm
+            for queue in self.operation_queues.values():
+                if isinstance(queue, list) and queue:
+                    queue[:] = [(self._heap_key(op, algorithm, t - op.creation_time), seq, op)
+                                for _, seq, op in queue]
+                    heapq.heapify(queue)
+    
     def add_operation(self, device_id: int, io_operation: IOOperation):
         """Agregar una operación a la cola para un dispositivo específico"""
-        # Crear cola para el dispositivo si no existe
-        if device_id not in self.operation_queues:
-            if self.algorithm == SchedulingAlgorithm.FIFO:
-                self.operation_queues[device_id] = Queue()
-            elif self.algorithm == SchedulingAlgorithm.PRIORIDAD:
-                self.operation_queues[device_id] = PriorityQueue()
+        with self._lock:
+            # Crear cola para el dispositivo si no existe
+            queue = self.operation_queues.get(device_id)
+            if queue is None:
+                queue = self.operation_queues[device_id] = self._new_queue(self.algorithm)
+            
+            # Agregar operación a la cola
+            self._push(queue, io_operation, self.algorithm)
+            self._counts[device_id] = len(queue)
+        logger.info("Operación agregada a la cola para el dispositivo %s: %s", device_id, io_operation)
+    
+    def add_operations(self, operations: Iterable[Tuple[int, IOOperation]]):
+        """Agregar varias operaciones (pares dispositivo, operación) adquiriendo el cerrojo una sola vez"""
+        operations = list(operations)
+        with self._lock:
+            algorithm = self.algorithm
+            queues = self.operation_queues
+            for device_id, io_operation in operations:
+                queue = queues.get(device_id)
+                if queue is None:
+                    queue = queues[device_id] = self._new_queue(algorithm)
+                self._push(queue, io_operation, algorithm)
+                self._counts[device_id] = len(queue)
+        logger.info("%d operaciones agregadas a las colas", len(operations))
+    
+    def requeue_operations(self, device_id: int, operations: List[IOOperation]):
+        """Devolver a la cola de un dispositivo operaciones extraídas que no llegaron a ejecutarse"""
+        with self._lock:
+            queue = self.operation_queues.get(device_id)
+            if queue is None:
+                queue = self.operation_queues[device_id] = self._new_queue(self.algorithm)
+            if isinstance(queue, list):
+                # Vuelven con la espera acumulada desde su creación, como en apply_aging
+                t = now()
+                for io_operation in operations:
+                    self._push(queue, io_operation, self.algorithm, t - io_operation.creation_time)
             else:
-                self.operation_queues[device_id] = Queue()  # Por defecto FIFO
-        
-        # Agregar operación a la cola
-        self.operation_queues[device_id].put(io_operation)
-        logger.info(f"Operación agregada a la cola para el dispositivo {device_id}: {io_operation}")
+                queue.extendleft(reversed(operations))  # Al frente, conservando su orden
+            self._counts[device_id] = len(queue)
     
     def get_next_operation(self, device_id: int) -> Optional[IOOperation]:
         """Obtener la siguiente operación para un dispositivo específico basado en el algoritmo de planificación"""
-        if device_id not in self.operation_queues or self.operation_queues[device_id].empty():
-            return None
-            
-        # Obtener la siguiente operación basada en el algoritmo
-        if self.algorithm == SchedulingAlgorithm.FIFO:
-            return self.operation_queues[device_id].get()
-        elif self.algorithm == SchedulingAlgorithm.PRIORIDAD:
-            return self.operation_queues[device_id].get()
-        elif self.algorithm == SchedulingAlgorithm.TRABAJO_MAS_CORTO_PRIMERO:
-            # Para SJF, necesitamos encontrar el trabajo más corto
-            # Esta es una implementación simplificada que no mantiene el orden de la cola
-            queue = self.operation_queues[device_id]
-            operations = []
-            while not queue.empty():
-                operations.append(queue.get())
-                
-            if not operations:
+        if self.algorithm == SchedulingAlgorithm.PASSTHROUGH:
+            operations = self._take_passthrough(device_id, 1)
+            return operations[0] if operations else None
+        with self._lock:
+            queue = self.operation_queues.get(device_id)
+            if not queue:
                 return None
                 
-            # Encontrar el trabajo más corto
-            shortest_op = min(operations, key=lambda op: op.data_size_mb)
-            
-            # Poner las otras operaciones de vuelta en la cola
-            for op in operations:
-                if op != shortest_op:
-                    queue.put(op)
-                    
-            return shortest_op
-        else:
-            # Por defecto FIFO
-            return self.operation_queues[device_id].get()
+            # PRIORIDAD y SJF: la cima del montículo es la siguiente operación
+            if isinstance(queue, list):
+                io_operation = heapq.heappop(queue)[2]
+            else:
+                io_operation = queue.popleft()  # FIFO y por defecto
+            self._counts[device_id] = len(queue)
+            return io_operation
+    
+    def get_next_operations(self, device_id: int, max_count: int) -> List[IOOperation]:
+        """Obtener hasta max_count operaciones para un dispositivo en orden de planificación"""
+        if self.algorithm == SchedulingAlgorithm.PASSTHROUGH:
+            return self._take_passthrough(device_id, max_count)
+        with self._lock:
+            queue = self.operation_queues.get(device_id)
+            if not queue:
+                return []
+            count = min(max_count, len(queue))
+            if isinstance(queue, list):
+                operations = [heapq.heappop(queue)[2] for _ in range(count)]
+            else:
+                operations = [queue.popleft() for _ in range(count)]
+            self._counts[device_id] = len(queue)
+            return operations
+    
+    def _take_passthrough(self, device_id: int, max_count: int) -> List[IOOperation]:
+        """Extraer operaciones de una cola FIFO sin tomar el cerrojo (modo PASSTHROUGH, un solo consumidor)"""
+        queue = self.operation_queues.get(device_id)
+        operations = []
+        if isinstance(queue, deque):
+            popleft = queue.popleft
+            try:
+                while len(operations) < max_count:
+                    operations.append(popleft())
+            except IndexError:
+                pass
+        return operations
     
     def get_queue_length(self, device_id: int) -> int:
         """Obtener el número de operaciones en la cola para un dispositivo específico"""
-        if device_id not in self.operation_queues:
-            return 0
-        return self.operation_queues[device_id].qsize()
+        if self.algorithm == SchedulingAlgorithm.PASSTHROUGH:
+            # El consumidor no toma el cerrojo, así que _counts no se actualiza al extraer: leer la deque
+            queue = self.operation_queues.get(device_id)
+            return len(queue) if queue is not None else 0
+        # Lectura de un único diccionario: atómica con el GIL, no necesita el cerrojo
+        return self._counts.get(device_id, 0)
+
+class OpRecord(NamedTuple):
+    """
+    Registro inmutable de una operación procesada por el Gestor de E/S.
+    creation_time es hora de pared (now()); start_time_ns y completion_time_ns son instantes
+    monotónicos (now_ns()). IOManager.get_operation_records los convierte a hora de pared.
+    """
+    operation_id: int
+    device_id: int
+    device_name: str
+    operation_type: str
+    data_size_mb: float
+    process_name: str
+    priority: int
+    creation_time: float
+    start_time_ns: Optional[int]
+    completion_time_ns: Optional[int]
+    status: str
+    success: bool
+
+# Registro estructurado de operaciones para análisis vectorizado con NumPy
+HIST_DT = np.dtype([
+    ('op_id', 'i8'), ('device_id', 'i4'), ('data_mb', 'f8'), ('start_ns', 'i8'),
+    ('completion_ns', 'i8'), ('success', '?'), ('op_type', 'u1'), ('priority', 'i2')
+])
 
 class IOManager(threading.Thread):
     """
     Administra operaciones de E/S procesando operaciones en cola y delegándolas a los controladores de dispositivos.
     """
-    def __init__(self, driver_table: DeviceDriverTable, io_scheduler: IOScheduler):
+    def __init__(self, driver_table: DeviceDriverTable, io_scheduler: IOScheduler, batch_size: int = 8):
         super().__init__()
         self.daemon = True
         self.driver_table = driver_table
         self.io_scheduler = io_scheduler
+        self.batch_size = batch_size  # Máximo de operaciones enviadas juntas a un dispositivo
         self.running = True
-        self.stats = {
-            "operations_processed": 0,
-            "operations_succeeded": 0,
-            "operations_failed": 0,
-            "total_data_mb": 0,
-            "start_time": time.time()
-        }
-        self.operation_history = []
-        self.status_listeners = []
+        # Contadores como atributos simples: solo los escribe el hilo del gestor
+        self.operations_processed = 0
+        self.operations_succeeded = 0
+        self.operations_failed = 0
+        self.total_data_mb = 0.0
+        self.start_time = now()  # Hora de pared de inicio, para informes
+        self.start_ns = now_ns()  # Instante monotónico de inicio, para medir el tiempo de ejecución
+        # El historial está desactivado hasta que alguien lo pida con enable_history()
+        self._history_enabled = False
+        self._history_size = 0
+        self.operation_history = deque(maxlen=0)  # OpRecord; se descartan los más antiguos
+        self.history_array = np.zeros(0, dtype=HIST_DT)  # Mismo historial para las agregaciones
+        self._history_count = 0  # Total de operaciones registradas; el índice de escritura es count % N
+        self._listeners: Tuple[Callable, ...] = ()  # Inmutable: se reemplaza entero al agregar oyentes
+        self._wake = threading.Event()  # Se activa cuando hay trabajo nuevo o al detenerse
+        self._ready: set = set()  # Dispositivos con operaciones en cola
+        self._ready_lock = threading.Lock()
+        # Las notificaciones se entregan desde un hilo propio para que un oyente lento no frene el despacho
+        self._notify_q = SimpleQueue()
+        self._notify_thread = threading.Thread(target=self._notify_loop, name="IOManagerNotify", daemon=True)
+        
+    def _notify_loop(self):
+        """Entregar los eventos de finalización a los oyentes de estado"""
+        while True:
+            event = self._notify_q.get()
+            if event is None:
+                break
+            for listener in self._listeners:
+                try:
+                    listener(*event)
+                except Exception as e:
+                    logger.error("Error en el oyente de estado: %s", e)
+        
+    def enable_history(self, size: int = OPERATION_HISTORY_MAXLEN):
+        """Activar el registro de las últimas `size` operaciones (OpRecord y búfer estructurado)"""
+        self.operation_history = deque(maxlen=size)
+        self.history_array = np.zeros(size, dtype=HIST_DT)
+        self._history_size = size
+        self._history_count = 0
+        self._history_enabled = True
+        
+    def _mark_ready(self, device_id: int):
+        """Marcar un dispositivo como pendiente de atender"""
+        with self._ready_lock:
+            self._ready.add(device_id)
+        
+    def _drain_ready(self) -> List[int]:
+        """Extraer de una vez todos los dispositivos pendientes"""
+        with self._ready_lock:
+            ready = list(self._ready)
+            self._ready.clear()
+        return ready
+        
+    def _resync_ready(self):
+        """Reconstruir el conjunto de pendientes a partir de las colas del planificador"""
+        with self._ready_lock:
+            self._ready.update(device_id for device_id in list(self.io_scheduler.operation_queues)
+                               if self.io_scheduler.get_queue_length(device_id) > 0)
         
     def run(self):
         """Bucle principal de procesamiento"""
         logger.info("Gestor de E/S iniciado")
+        self._notify_thread.start()
+        
+        # Instantánea de los controladores, renovada solo cuando cambia la tabla
+        drivers_version, drivers, names = -1, {}, {}
+        last_aging_ns = now_ns()
         
         while self.running:
             try:
-                # Procesar operaciones para todos los dispositivos
-                for device_id in list(self.driver_table.get_all_drivers().keys()):
-                    # Obtener el controlador para este dispositivo
-                    driver = self.driver_table.get_driver(device_id)
-                    
-                    # Saltar si no se encuentra el controlador o el dispositivo está ocupado
-                    if not driver or driver.dcb.status == DeviceStatus.OCUPADO:
-                        continue
-                    
-                    # Obtener la siguiente operación para este dispositivo
-                    io_operation = self.io_scheduler.get_next_operation(device_id)
-                    
-                    # Procesar la operación si hay una disponible
-                    if io_operation:
-                        self.stats["operations_processed"] += 1
-                        
-                        # Realizar la operación
-                        success = driver.perform_operation(io_operation)
-                        
-                        # Actualizar estadísticas
-                        if success:
-                            self.stats["operations_succeeded"] += 1
-                            self.stats["total_data_mb"] += io_operation.data_size_mb
-                        else:
-                            self.stats["operations_failed"] += 1
-                        
-                        # Agregar al historial de operaciones
-                        op_record = {
-                            "operation_id": io_operation.operation_id,
-                            "device_id": device_id,
-                            "device_name": driver.dcb.device_name,
-                            "operation_type": io_operation.operation_type.name,
-                            "data_size_mb": io_operation.data_size_mb,
-                            "process_name": io_operation.process_name,
-                            "priority": io_operation.priority,
-                            "creation_time": io_operation.creation_time,
-                            "start_time": io_operation.start_time,
-                            "completion_time": io_operation.completion_time,
-                            "status": io_operation.status,
-                            "success": success
-                        }
-                        self.operation_history.append(op_record)
-                        
-                        # Notificar a los oyentes de estado
-                        for listener in self.status_listeners:
-                            try:
-                                listener(device_id, io_operation, success)
-                            except Exception as e:
-                                logger.error(f"Error en el oyente de estado: {e}")
+                # Limpiar antes de recorrer las colas para no perder avisos que lleguen durante el recorrido
+                self._wake.clear()
+                tick_ns = now_ns()  # Una sola lectura del reloj por vuelta
+                
+                if self.driver_table._drivers_version != drivers_version:
+                    drivers_version = self.driver_table._drivers_version
+                    drivers = self.driver_table.get_all_drivers()
+                    names = dict(self.driver_table._names)
                 
-                # Dormir brevemente para evitar consumo excesivo de CPU
-                time.sleep(0.1)
+                # Procesar operaciones solo para los dispositivos con trabajo pendiente
+                dispatched = self._dispatch(self._drain_ready(), drivers, names) > 0
+                
+                # Envejecer las colas con montículo una vez por segundo
+                if tick_ns - last_aging_ns >= 1_000_000_000:
+                    self.io_scheduler.apply_aging()
+                    last_aging_ns = tick_ns
+                
+                # Bloquear hasta que llegue trabajo; el tiempo límite cubre dispositivos que vuelven a estar disponibles
+                if not dispatched and not self._wake.wait(timeout=1.0):
+                    # Sin avisos durante el intervalo: recuperar operaciones que no pasaron por add_io_operation
+                    self._resync_ready()
                 
             except Exception as e:
                 logger.error(f"Error en el Gestor de E/S: {e}")
                 time.sleep(1)  # Dormir más tiempo en caso de error
+        
+        # Entregar las notificaciones pendientes y terminar el hilo de notificación
+        self._notify_q.put(None)
+    
+    def _dispatch(self, ready: List[int], drivers: Dict[int, DeviceDriver], names: Dict[int, str]) -> int:
+        """
+        Despachar un lote de operaciones por cada dispositivo listo y registrar sus resultados.
+        Devuelve el número de operaciones procesadas. Los atributos y métodos usados por operación
+        se enlazan a variables locales y los contadores se acumulan localmente.
+        """
+        scheduler = self.io_scheduler
+        get_next_operations = scheduler.get_next_operations
+        requeue_operations = scheduler.requeue_operations
+        get_queue_length = scheduler.get_queue_length
+        mark_ready = self._mark_ready
+        record_history = self._history_enabled
+        history_append = self.operation_history.append
+        history_array = self.history_array
+        history_size = self._history_size
+        notify = self._notify_q.put if self._listeners else None
+        op_type_name = _OP_TYPE_NAME
+        batch_size = self.batch_size
+        
+        processed = succeeded = failed = 0
+        data_mb = 0.0
+        history_count = self._history_count
+        
+        for device_id in ready:
+            # Obtener el controlador para este dispositivo
+            driver = drivers.get(device_id)
+            
+            # Saltar si no se encuentra el controlador (se recupera al resincronizar)
+            if not driver:
+                continue
+            
+            # Reservar el dispositivo; si no está libre (ocupado, desconectado o con error) reintentar más tarde
+            if not driver.try_claim():
+                mark_ready(device_id)
+                continue
+            
+            # Obtener un lote de operaciones para este dispositivo
+            operations = get_next_operations(device_id, batch_size)
+            if not operations:
+                driver.release_claim()
+                continue
+            
+            # Realizar las operaciones: los lotes de más de una van juntos al controlador
+            if len(operations) == 1:
+                results = [driver.perform_operation(operations[0], claimed=True)]
+            else:
+                results = driver.perform_batch(operations, claimed=True)
+                
+                # Las operaciones que no se ejecutaron (dispositivo no disponible) vuelven a la cola
+                if None in results:
+                    requeue_operations(device_id, [op for op, success in zip(operations, results) if success is None])
+            
+            # Las dos instantáneas se toman por separado: si el nombre aún no está, leerlo del DCB
+            device_name = names.get(device_id) or driver.dcb.device_name
+            for io_operation, success in zip(operations, results):
+                if success is None:
+                    continue  # Devuelta a la cola: se contará cuando se ejecute
+                processed += 1
+                size = io_operation.data_size_mb
+                
+                # Actualizar estadísticas
+                if success:
+                    succeeded += 1
+                    data_mb += size
+                else:
+                    failed += 1
+                
+                # Agregar al historial de operaciones
+                if record_history:
+                    start_ns = io_operation.start_time_ns
+                    completion_ns = io_operation.completion_time_ns
+                    history_append(OpRecord(
+                        io_operation.operation_id,
+                        device_id,
+                        device_name,
+                        op_type_name[io_operation.operation_type],
+                        size,
+                        io_operation.process_name,
+                        io_operation.priority,
+                        io_operation.creation_time,
+                        start_ns,
+                        completion_ns,
+                        io_operation.status,
+                        success
+                    ))
+                    
+                    history_array[history_count % history_size] = (
+                        io_operation.operation_id, device_id, size, start_ns or 0, completion_ns or 0,
+                        success, io_operation.operation_type.value, io_operation.priority
+                    )
+                    history_count += 1
+                
+                # Notificar a los oyentes de estado (en segundo plano)
+                if notify is not None:
+                    notify((device_id, io_operation, success))
+            
+            # Seguir atendiendo el dispositivo mientras tenga operaciones en cola
+            if get_queue_length(device_id) > 0:
+                mark_ready(device_id)
+        
+        self._history_count = history_count
+        self.operations_processed += processed
+        self.operations_succeeded += succeeded
+        self.operations_failed += failed
+        self.total_data_mb += data_mb
+        return processed
     
     def stop(self):
         """Detener el Gestor de E/S"""
         logger.info("Deteniendo el Gestor de E/S")
         self.running = False
+        self._wake.set()
+        
+    def wake(self):
+        """Despertar el bucle de procesamiento, p. ej. cuando un dispositivo vuelve a estar disponible"""
+        self._resync_ready()
+        self._wake.set()
         
     def add_io_operation(self, device_id: int, io_operation: IOOperation):
         """Agregar una operación de E/S al planificador"""
         self.io_scheduler.add_operation(device_id, io_operation)
+        self._mark_ready(device_id)
+        self._wake.set()
+        
+    def add_io_operations(self, operations: Iterable[Tuple[int, IOOperation]]):
+        """Agregar varias operaciones de E/S (pares dispositivo, operación) con un solo despertar"""
+        operations = list(operations)
+        self.io_scheduler.add_operations(operations)
+        with self._ready_lock:
+            self._ready.update(device_id for device_id, _ in operations)
+        self._wake.set()
+        
+    @property
+    def status_listeners(self) -> Tuple[Callable, ...]:
+        """Oyentes de estado registrados"""
+        return self._listeners
         
     def add_status_listener(self, listener: Callable):
         """Agregar un oyente para ser notificado de cambios en el estado de las operaciones"""
-        self.status_listeners.append(listener)
+        self._listeners = self._listeners + (listener,)
+        
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Instantánea de los contadores con la forma del antiguo diccionario de estadísticas"""
+        return {
+            "operations_processed": self.operations_processed,
+            "operations_succeeded": self.operations_succeeded,
+            "operations_failed": self.operations_failed,
+            "total_data_mb": self.total_data_mb,
+            "start_time": self.start_time
+        }
+        
+    def get_runtime(self) -> float:
+        """Segundos transcurridos desde que se creó el gestor"""
+        return (now_ns() - self.start_ns) * 1e-9
+        
+    def wall_time(self, t_ns: Optional[int]) -> Optional[float]:
+        """Convertir un instante monotónico (now_ns) a hora de pared usando el inicio del gestor como referencia"""
+        if t_ns is None:
+            return None
+        return self.start_time + (t_ns - self.start_ns) * 1e-9
+        
+    def get_operation_records(self) -> List[Dict[str, Any]]:
+        """Historial de operaciones como diccionarios con start_time y completion_time en hora de pared"""
+        wall_time = self.wall_time
+        return [
+            {
+                "operation_id": op.operation_id,
+                "device_id": op.device_id,
+                "device_name": op.device_name,
+                "operation_type": op.operation_type,
+                "data_size_mb": op.data_size_mb,
+                "process_name": op.process_name,
+                "priority": op.priority,
+                "creation_time": op.creation_time,
+                "start_time": wall_time(op.start_time_ns),
+                "completion_time": wall_time(op.completion_time_ns),
+                "status": op.status,
+                "success": op.success
+            }
+            for op in self.operation_history.copy()  # Copia: el hilo del gestor sigue agregando registros
+        ]
         
     def get_throughput(self) -> float:
         """Calcular el rendimiento en MB/s"""
-        elapsed_time = time.time() - self.stats["start_time"]
+        elapsed_time = self.get_runtime()
         if elapsed_time > 0:
-            return self.stats["total_data_mb"] / elapsed_time
+            return self.total_data_mb / elapsed_time
         return 0
         
+    def get_device_stats(self) -> Dict[int, Dict[str, float]]:
+        """Estadísticas por dispositivo sobre el historial reciente, calculadas con NumPy"""
+        hist = self.history_array[:min(self._history_count, self._history_size)]
+        if not hist.size:
+            return {}
+        device_ids = hist['device_id']
+        success = hist['success']
+        operations = np.bincount(device_ids)
+        succeeded = np.bincount(device_ids, weights=success)
+        data_mb = np.bincount(device_ids, weights=np.where(success, hist['data_mb'], 0.0))
+        busy_s = np.bincount(device_ids, weights=(hist['completion_ns'] - hist['start_ns']) * 1e-9)
+        return {
+            int(device_id): {
+                "operations": int(operations[device_id]),
+                "success_rate": float(succeeded[device_id] / operations[device_id] * 100),
+                "data_mb": float(data_mb[device_id]),
+                "throughput_mb_s": float(data_mb[device_id] / busy_s[device_id]) if busy_s[device_id] > 0 else 0.0
+            }
+            for device_id in np.flatnonzero(operations)
+        }
+        
     def get_success_rate(self) -> float:
         """Calcular la tasa de éxito como porcentaje"""
-        total = self.stats["operations_succeeded"] + self.stats["operations_failed"]
+        total = self.operations_succeeded + self.operations_failed
         if total > 0:
-            return (self.stats["operations_succeeded"] / total) * 100
+            return (self.operations_succeeded / total) * 100
         return 0
 
 # Función de prueba simple para verificar la funcionalidad principal
 def test_core_functionality():
     """Prueba la funcionalidad principal del sistema"""
     # Crear los componentes principales
-    interrupt_table = InterruptTable()
+    interrupt_table = InterruptTable(record_history=True)
     buffer_manager = BufferManager(2048)  # Búfer de 2MB
     driver_table = DeviceDriverTable()
     io_scheduler = IOScheduler(SchedulingAlgorithm.FIFO)
@@ -709,7 +1550,10 @@ def test_core_functionality():
     driver_table.register_driver(usb_dcb.device_id, usb_driver)
     
     # Conectar la unidad USB
-    interrupt_table.trigger_interrupt("UNIDAD_USB_CONNECT")  # Revertido a CONNECT
+    interrupt_table.trigger_interrupt(usb_driver.connect_event)
+    
+    # Los manejadores ya están registrados y probados: despachar sin try/except
+    interrupt_table.safe_dispatch = False
     
     # Crear e iniciar el Gestor de E/S
     io_manager = IOManager(driver_table, io_scheduler)
@@ -734,5 +1578,40 @@ def test_core_functionality():
     
     print("Prueba de funcionalidad principal completada")
 
+def test_passthrough_concurrency(producers: int = 4, operations_per_producer: int = 500):
+    """Prueba que el consumidor sin cerrojo de PASSTHROUGH no pierde ni duplica operaciones"""
+    io_scheduler = IOScheduler(SchedulingAlgorithm.PASSTHROUGH)
+    total = producers * operations_per_producer
+    taken: List[IOOperation] = []
+    
+    def produce():
+        # Encolar en lotes pequeños para intercalar con el consumidor
+        for start in range(0, operations_per_producer, 10):
+            count = min(10, operations_per_producer - start)
+            io_scheduler.add_operations(
+                (1, IOOperation(OperationType.ESCRITURA, 0.1, "ProcesoPrueba")) for _ in range(count))
+    
+    def consume():
+        # Un único consumidor, como el Gestor de E/S, mientras los productores siguen encolando
+        deadline = time.monotonic() + 10
+        while len(taken) < total and time.monotonic() < deadline:
+            taken.extend(io_scheduler.get_next_operations(1, 8))
+    
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    consumer.join()
+    
+    assert len(taken) == total, f"Se extrajeron {len(taken)} de {total} operaciones"
+    assert len({op.operation_id for op in taken}) == total, "Operaciones duplicadas"
+    assert io_scheduler.get_queue_length(1) == 0
+    
+    print("Prueba de concurrencia de PASSTHROUGH completada")
+
 if __name__ == "__main__":
     test_core_functionality()
+    test_passthrough_concurrency()
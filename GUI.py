@@ -4,26 +4,231 @@ Este módulo contiene la interfaz gráfica de usuario para el sistema de simulac
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import os
 import numpy as np
 import json
+try:
+    import orjson  # Opcional: serialización JSON en C para guardar, cargar y exportar
+except ImportError:
+    orjson = None
 import logging
 import time
 import threading
 import random
-from queue import Queue
+import socket
+import functools
+from collections import deque
+from contextlib import contextmanager
+from queue import SimpleQueue, Empty
+from concurrent.futures import ThreadPoolExecutor, wait
 import sys
-import os
 
 # Importar los componentes principales desde Driver_USB.py
 from Driver_USB import (
     DeviceType, OperationType, DeviceStatus, SchedulingAlgorithm,
     DeviceControlBlock, IOOperation, InterruptTable, Buffer, BufferManager,
     DeviceDriver, BlockDeviceDriver, CharacterDeviceDriver,
-    DeviceDriverTable, IOScheduler, IOManager, logger
+    DeviceDriverTable, IOScheduler, IOManager, logger, stop_log_listener
 )
 
+# Tamaño de las series de los gráficos y ventana de tiempo visible (segundos)
+CHART_POINTS = 600
+CHART_WINDOW_S = 60
+
+# Límites iniciales del eje Y; solo se amplían (con un redibujado completo) si los datos los superan
+THROUGHPUT_YLIM_MB_S = 10
+QUEUE_YLIM = 50
+
+# Resolución de la figura de monitoreo: menos DPI implica menos píxeles que rasterizar por dibujo
+CHART_DPI = int(os.environ.get("MPL_DPI", "72"))
+CHART_DPI_CHOICES = (60, 72, 100)
+
+# Operaciones completadas que se muestran en la lista de operaciones y que conserva el historial
+OPERATIONS_LIST_MAX = 100
+OPERATION_HISTORY_MAX = 1000
+
+# Periodo del temporizador compartido de la GUI
+TICK_MS = 250
+
+# Tiempo que permanece un aviso de éxito en la barra de estado
+STATUS_MESSAGE_MS = 3000
+
+# Espera máxima al hilo del Gestor de E/S y a las escrituras de archivos pendientes al salir (segundos)
+EXIT_JOIN_TIMEOUT_S = 2.0
+
+# Intervalo de actualización de estadísticas con actividad, en reposo y con la ventana oculta (segundos)
+STATS_BUSY_INTERVAL_S = 0.2
+STATS_IDLE_INTERVAL_S = 2.0
+STATS_HIDDEN_INTERVAL_S = 10.0
+
+# Los gráficos se actualizan tras este número de operaciones nuevas o, como muy tarde, tras este tiempo
+CHART_REDRAW_MIN_OPS = 32
+CHART_REDRAW_MAX_AGE_S = 2.0
+
+# Líneas máximas conservadas en el visor de registro, holgura antes de recortar y mensajes escritos por cada vaciado
+LOG_MAX_LINES = 5000
+LOG_TRIM_SLACK = 500
+LOG_FLUSH_BATCH = 500
+
+# Los mensajes idénticos de la GUI repetidos dentro de esta ventana se descartan (segundos)
+LOG_DEDUP_WINDOW_S = 0.5
+LOG_DEDUP_MAX_KEYS = 256
+
+# Al guardar el registro se lee el widget por bloques de líneas; los archivos se escriben con un búfer grande
+LOG_SAVE_CHUNK_LINES = 2000
+FILE_WRITE_BUFFER_BYTES = 256 * 1024
+
+# Color de cada estado en el gráfico de estado de los dispositivos (naranja para cualquier otro)
+STATUS_COLORS = {
+    DeviceStatus.CONECTADO: 'green',
+    DeviceStatus.OCUPADO: 'blue',
+    DeviceStatus.ERROR: 'red',
+    DeviceStatus.DESCONECTADO: 'gray'
+}
+
+class _LogDedup(logging.Filter):
+    """Filtro que descarta los mensajes repetidos de la GUI emitidos dentro de LOG_DEDUP_WINDOW_S"""
+    
+    def __init__(self):
+        super().__init__()
+        self._last_seen = {}  # (nivel, mensaje, argumentos) -> instante monotónico de la última emisión
+    
+    def filter(self, record):
+        if record.pathname != __file__:
+            return True  # Solo se agrupan los mensajes de la GUI; los del simulador pasan siempre
+        try:
+            key = (record.levelno, record.msg, tuple(record.args) if record.args else ())
+            hash(key)
+        except TypeError:
+            return True  # Argumentos no hashables: no se puede agrupar
+        
+        t = time.monotonic()
+        last = self._last_seen.get(key)
+        if last is not None and t - last < LOG_DEDUP_WINDOW_S:
+            return False
+        
+        # Olvidar las claves caducadas cuando el diccionario crece demasiado
+        if len(self._last_seen) >= LOG_DEDUP_MAX_KEYS:
+            self._last_seen = {k: v for k, v in self._last_seen.items() if t - v < LOG_DEDUP_WINDOW_S}
+        self._last_seen[key] = t
+        return True
+
+logger.addFilter(_LogDedup())
+
+def gui_action(error_message, show_error=False):
+    """Decorador para los comandos de la GUI: registra las excepciones (y opcionalmente las muestra al usuario)"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"{error_message}: {e}")
+                if show_error:
+                    messagebox.showerror("Error", f"{error_message}: {e}")
+        return wrapper
+    return decorator
+
+def _json_default(obj):
+    """Convertir escalares de NumPy a tipos nativos al serializar JSON"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tipo no serializable en JSON: {type(obj).__name__}")
+
+def _dumps_json(data):
+    """Serializar datos a bytes JSON compactos (con orjson si está instalado)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode()
+
+def _loads_json(raw):
+    """Decodificar bytes JSON (con orjson si está instalado)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+class ChartSeries:
+    """
+    Serie temporal de tamaño fijo para los gráficos, sobre arreglos NumPy preasignados.
+    """
+    def __init__(self, capacity=CHART_POINTS):
+        self.time = np.zeros(capacity, dtype=np.float32)
+        self.value = np.zeros(capacity, dtype=np.float32)
+        self.index = 0  # Posición de la próxima escritura
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, t, value):
+        """Agregar una muestra sobrescribiendo la más antigua si la serie está llena"""
+        i = self.index
+        self.time[i] = t
+        self.value[i] = value
+        self.index = (i + 1) % len(self.time)
+        if self.count < len(self.time):
+            self.count += 1
+    
+    def ordered(self):
+        """Obtener (tiempos, valores) en orden cronológico; sin copia mientras la serie no da la vuelta"""
+        if self.count < len(self.time):
+            return self.time[:self.count], self.value[:self.count]
+        i = self.index
+        return (np.concatenate((self.time[i:], self.time[:i])),
+                np.concatenate((self.value[i:], self.value[:i])))
+    
+    def relative(self):
+        """Obtener la serie con el tiempo relativo a la última muestra"""
+        times, values = self.ordered()
+        return times - self.time[self.index - 1], values
+
+class QueueLengthSeries:
+    """
+    Longitudes de cola de todos los dispositivos en una matriz (dispositivos x muestras) con tiempos compartidos.
+    """
+    def __init__(self, capacity=CHART_POINTS):
+        self.time = np.zeros(capacity, dtype=np.float32)
+        self.values = np.zeros((0, capacity), dtype=np.float32)
+        self.rows = {}  # device_id -> fila de la matriz
+        self.names = []  # Nombre del dispositivo de cada fila
+        self.index = 0  # Posición de la próxima escritura
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, t, samples):
+        """Agregar una muestra con (device_id, nombre, longitud) por dispositivo; los ausentes quedan a 0"""
+        i = self.index
+        values = self.values
+        column = np.zeros(len(self.names), dtype=np.float32)
+        for device_id, device_name, length in samples:
+            row = self.rows.get(device_id)
+            if row is None:
+                # Dispositivo nuevo: una fila de ceros (se agregan muy rara vez)
+                row = self.rows[device_id] = len(self.names)
+                self.names.append(device_name)
+                values = np.vstack((values, np.zeros((1, values.shape[1]), dtype=np.float32)))
+                column = np.append(column, np.float32(0))
+            column[row] = length
+        values[:, i] = column
+        self.values = values
+        self.time[i] = t
+        self.index = (i + 1) % len(self.time)
+        if self.count < len(self.time):
+            self.count += 1
+    
+    def relative(self):
+        """Obtener (tiempos relativos a la última muestra, matriz de longitudes) en orden cronológico"""
+        values = self.values
+        if self.count < len(self.time):
+            times, values = self.time[:self.count], values[:, :self.count]
+        else:
+            i = self.index
+            times = np.concatenate((self.time[i:], self.time[:i]))
+            values = np.concatenate((values[:, i:], values[:, :i]), axis=1)
+        return times - self.time[self.index - 1], values
+
 class IOSimulationGUI:
     """
     Interfaz gráfica de usuario para el sistema de simulación de E/S.
@@ -46,52 +251,200 @@ class IOSimulationGUI:
         self.io_manager = None  # Se inicializará después de configurar la GUI
         
         # Cola para actualizaciones seguras en el hilo de la GUI
-        self.update_queue = Queue()
-        
-        # Configurar temporizador de actualizaciones
+        # Cada acción se encola una sola vez mientras siga pendiente de procesar
+        self.update_queue = SimpleQueue()
+        self._pending_actions = set()
+        self._pending_lock = threading.Lock()
+        
+        # Canal de aviso: los productores escriben un byte y Tk atiende la cola sin sondeo;
+        # donde Tk no admite manejadores de archivo (Windows) se sondea con after
+        self._wakeup_r = self._wakeup_w = None
+        self._setup_update_channel()
+        
+        # Hilo único para la E/S de archivos (guardar, cargar, exportar): escrituras en orden y sin bloquear Tk
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-io")
+        
+        # Un único temporizador atiende la cola (si no hay canal de aviso), las estadísticas y los gráficos
+        self._stats_started = False
+        self._last_ops_processed = 0  # Operaciones procesadas en la última actualización de estadísticas
+        self._last_stats_ts = 0.0
+        self._last_chart_ops = 0  # Operaciones procesadas en la última actualización de gráficos
+        self._last_redraw_ts = 0.0
+        
+        # Con la ventana minimizada se espacian las estadísticas y no se dibujan los gráficos
+        self._visible = True
+        self.master.bind("<Map>", self._on_window_map, add="+")
+        self.master.bind("<Unmap>", self._on_window_unmap, add="+")
+        
+        # Cerrar la ventana pasa por la misma salida ordenada que el menú
+        self._shutting_down = False
+        self.master.protocol("WM_DELETE_WINDOW", self.exit_application)
         self.master.after(100, self.initialize_io_manager)
-        self.master.after(200, self.process_update_queue)
+        self.master.after(TICK_MS, self._tick)
         
     def initialize_io_manager(self):
         """Inicializar el Gestor de E/S después de configurar la GUI"""
-        # Crear y iniciar el Gestor de E/S de manera que no bloquee la GUI
+        # Crear y iniciar el Gestor de E/S de manera que no bloquee la GUI; el hilo de trabajo
+        # no toca Tk: solo produce eventos en la cola de actualizaciones
         def setup_io_manager():
             self.io_manager = IOManager(self.driver_table, self.io_scheduler)
+            self.io_manager.enable_history(OPERATION_HISTORY_MAX)
             self.io_manager.add_status_listener(self.queue_operation_status_update)
             self.io_manager.start()
             
             # Inicializar dispositivos
             self.initialize_default_devices()
             
-            # Iniciar temporizador de actualización de estadísticas
-            self.master.after(1000, self.update_stats)
+            # Calentamiento terminado: si los manejadores de conexión dejaron todos los dispositivos
+            # conectados, se consideran fiables y las interrupciones se despachan sin try/except
+            drivers = self.driver_table.get_all_drivers()
+            if drivers and all(driver.dcb.status == DeviceStatus.CONECTADO for driver in drivers.values()):
+                self.interrupt_table.safe_dispatch = False
+            
+            # Pedir al hilo principal que empiece a actualizar las estadísticas
+            self.post_update("start_stats")
         
         # Ejecutar en un hilo separado para evitar bloquear la GUI
         threading.Thread(target=setup_io_manager, daemon=True).start()
         
     def queue_operation_status_update(self, device_id, io_operation, success):
         """Colocar en cola una actualización de estado de operación para ser procesada por el hilo principal"""
-        self.update_queue.put(("update_operations_list", None))
+        self.post_update("update_operations_list")
+        
+    def post_update(self, action, data=None):
+        """Encolar una acción para el hilo principal si no está ya pendiente (las acciones con datos no se agrupan)"""
+        with self._pending_lock:
+            if data is None:
+                if action in self._pending_actions:
+                    return
+                self._pending_actions.add(action)
+            self.update_queue.put((action, data))
+        
+        # Despertar al hilo principal a través del canal de aviso
+        # Leer el socket una sola vez: otro hilo puede cerrarlo y anularlo entretanto
+        w = self._wakeup_w
+        if w is not None:
+            try:
+                w.send(b"\0")
+            except OSError:
+                pass  # Búfer lleno (ya hay un aviso pendiente) o canal cerrado
+    
+    def _setup_update_channel(self):
+        """Registrar un par de sockets como manejador de archivo de Tk para recibir avisos sin sondeo"""
+        if os.name == "nt" or not hasattr(self.master.tk, "createfilehandler"):
+            return
+        try:
+            reader, writer = socket.socketpair()
+            reader.setblocking(False)
+            writer.setblocking(False)
+            self.master.tk.createfilehandler(reader.fileno(), tk.READABLE, self._on_update_channel)
+        except Exception as e:
+            logger.warning(f"Canal de aviso no disponible, se usará sondeo: {e}")
+            return
+        self._wakeup_r, self._wakeup_w = reader, writer
+    
+    def _close_update_channel(self):
+        """Dar de baja el manejador de archivo y cerrar el par de sockets"""
+        if self._wakeup_r is None:
+            return
+        reader, writer = self._wakeup_r, self._wakeup_w
+        self._wakeup_r = self._wakeup_w = None
+        try:
+            self.master.tk.deletefilehandler(reader.fileno())
+        except Exception:
+            pass  # El intérprete de Tk podría estar destruido
+        reader.close()
+        writer.close()
+    
+    def _on_update_channel(self, fileobj, mask):
+        """Vaciar los avisos del canal y procesar la cola de actualizaciones una sola vez"""
+        try:
+            while self._wakeup_r.recv(4096):
+                pass
+        except OSError:
+            pass  # No quedan bytes por leer
+        with self._batched_draw():
+            self._drain_update_queue()
+    
+    def _tick(self):
+        """Temporizador compartido: vaciar la cola, actualizar estadísticas si toca y dibujar una sola vez"""
+        try:
+            with self._batched_draw():
+                if self._wakeup_r is None:
+                    self._drain_update_queue()  # Sin canal de aviso la cola se sondea en cada tic
+                if self._stats_started and self._stats_due():
+                    self.update_stats()
+        except Exception as e:
+            logger.error(f"Error en el temporizador de la GUI: {e}")
+        
+        # Programar el próximo tic
+        self.master.after(TICK_MS, self._tick)
+        
+    def _stats_due(self):
+        """Decidir si toca actualizar estadísticas: a menudo si avanzan los contadores, con calma en reposo"""
+        if not self.io_manager:
+            return False
+        if not self._visible:
+            interval = STATS_HIDDEN_INTERVAL_S
+        elif self.io_manager.operations_processed != self._last_ops_processed:
+            interval = STATS_BUSY_INTERVAL_S
+        else:
+            interval = STATS_IDLE_INTERVAL_S
+        return time.monotonic() - self._last_stats_ts >= interval
+    
+    def _on_window_unmap(self, event):
+        """Marcar la ventana como oculta (minimizada)"""
+        if event.widget is self.master:  # Ignorar los eventos propagados desde los widgets hijos
+            self._visible = False
+    
+    def _on_window_map(self, event):
+        """Marcar la ventana como visible y refrescar estadísticas y gráficos de inmediato"""
+        if event.widget is not self.master or self._visible:
+            return
+        self._visible = True
+        self._last_redraw_ts = 0.0  # Forzar también la actualización de los gráficos
+        if self._stats_started:
+            with self._batched_draw():
+                self.update_stats()
+    
+    def _drain_update_queue(self):
+        """Procesar las actualizaciones pendientes de la cola, ejecutando cada acción una sola vez"""
+        # Vaciar la cola y liberar las acciones para que puedan volver a encolarse
+        pending = set()
+        payloads = []
+        with self._pending_lock:
+            while True:
+                try:
+                    action, data = self.update_queue.get_nowait()
+                except Empty:
+                    break
+                if data is None:
+                    pending.add(action)
+                else:
+                    payloads.append((action, data))
+            self._pending_actions.clear()
         
-    def process_update_queue(self):
-        """Procesar actualizaciones de la cola en el hilo principal"""
         try:
-            # Procesar todas las actualizaciones pendientes
-            while not self.update_queue.empty():
-                action, data = self.update_queue.get_nowait()
-                
-                if action == "update_operations_list":
-                    self.update_operations_list()
-                elif action == "update_device_list":
-                    self.update_device_list()
-                # Agregar más acciones según sea necesario
+            if "start_stats" in pending:
+                self._stats_started = True
+            if "update_device_list" in pending:
+                self.update_device_list()
+            if "update_operations_list" in pending:
+                self.update_operations_list()
+            if "flush_log" in pending:
+                self._log_text_handler._flush()
+            for action, data in payloads:
+                if action == "apply_configuration":
+                    self._apply_configuration(*data)
+                elif action == "show_message":
+                    self._show_message(*data)
+            # Agregar más acciones según sea necesario
                 
         except Exception as e:
             logger.error(f"Error al procesar la cola de actualizaciones: {e}")
-            
-        # Programar la próxima verificación
-        self.master.after(100, self.process_update_queue)
         
+        return pending
+    
     def setup_menu(self):
         """Configurar el menú de la aplicación"""
         menubar = tk.Menu(self.master)
@@ -119,14 +472,29 @@ class IOSimulationGUI:
         # Submenú Algoritmo de Planificación
         scheduling_menu = tk.Menu(simulation_menu, tearoff=0)
         self.scheduling_var = tk.StringVar(value="FIFO")
+        # Nombre -> (algoritmo, mensaje de registro), resueltos una sola vez
+        self._alg_cache = {
+            algorithm.name: (algorithm, f"Algoritmo de planificación cambiado a {algorithm.name}")
+            for algorithm in SchedulingAlgorithm
+        }
         scheduling_menu.add_radiobutton(label="FIFO", variable=self.scheduling_var, 
                                        value="FIFO", command=self.change_scheduling_algorithm)
         scheduling_menu.add_radiobutton(label="Prioridad", variable=self.scheduling_var, 
-                                       value="PRIORITY", command=self.change_scheduling_algorithm)
+                                       value="PRIORIDAD", command=self.change_scheduling_algorithm)
         scheduling_menu.add_radiobutton(label="Trabajo Más Corto Primero", variable=self.scheduling_var, 
-                                       value="SHORTEST_JOB_FIRST", command=self.change_scheduling_algorithm)
+                                       value="TRABAJO_MAS_CORTO_PRIMERO", command=self.change_scheduling_algorithm)
+        scheduling_menu.add_radiobutton(label="Sin planificación (paso directo)", variable=self.scheduling_var, 
+                                       value="PASSTHROUGH", command=self.change_scheduling_algorithm)
         simulation_menu.add_cascade(label="Algoritmo de Planificación", menu=scheduling_menu)
         
+        # Submenú Resolución de los gráficos
+        dpi_menu = tk.Menu(simulation_menu, tearoff=0)
+        self.chart_dpi_var = tk.IntVar(value=CHART_DPI)
+        for dpi in CHART_DPI_CHOICES:
+            dpi_menu.add_radiobutton(label=f"{dpi} DPI", variable=self.chart_dpi_var,
+                                     value=dpi, command=self.change_chart_dpi)
+        simulation_menu.add_cascade(label="Resolución de los Gráficos", menu=dpi_menu)
+        
         simulation_menu.add_separator()
         simulation_menu.add_command(label="Generar Operaciones Aleatorias", command=self.generate_random_operations)
         simulation_menu.add_command(label="Limpiar Todas las Operaciones", command=self.clear_operations)
@@ -181,6 +549,7 @@ class IOSimulationGUI:
         
         self.status_label = ttk.Label(status_frame, text="Listo")
         self.status_label.pack(side=tk.LEFT)
+        self._status_reset_id = None  # Temporizador que restablece el texto de la barra de estado
         
         self.throughput_label = ttk.Label(status_frame, text="Rendimiento: 0 MB/s")
         self.throughput_label.pack(side=tk.RIGHT)
@@ -222,6 +591,8 @@ class IOSimulationGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.device_tree.bind("<<TreeviewSelect>>", self.on_device_selected)
+        self._device_rows = {}  # iid -> valores mostrados
+        self._device_row_cache = {}  # device_id -> (controlador, versión del DCB, fila precalculada)
         
         # Controles del dispositivo (marco derecho)
         control_frame = ttk.LabelFrame(right_frame, text="Controles del Dispositivo")
@@ -299,6 +670,12 @@ class IOSimulationGUI:
         self.operations_tree.configure(yscroll=scrollbar.set)
         
         self.operations_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._op_iids = deque()  # iids mostrados, del más antiguo al más reciente
+        self._last_op_record = None  # Último registro del historial ya insertado
+        self._devname_by_id = {}
+        self._id_by_devname = {}  # Índice inverso: nombre -> device_id
+        self._devname_source = None  # Vista de get_all_drivers con la que se construyeron los índices
+        self._combo_values = ()  # Últimos valores escritos en el combo de dispositivos
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Formulario de nueva operación (marco derecho)
@@ -346,16 +723,43 @@ class IOSimulationGUI:
         ttk.Button(actions_frame, text="Limpiar Todo", command=self.clear_operations).pack(side=tk.LEFT, padx=5)
     
     def setup_monitoring_tab(self, parent):
-        """Configurar la pestaña de monitoreo con gráficos en tiempo real"""
-        # Crear un marco para los gráficos
-        charts_frame = ttk.Frame(parent)
-        charts_frame.pack(fill=tk.BOTH, expand=True)
+        """Configurar la pestaña de monitoreo; los gráficos se construyen al mostrarla por primera vez"""
+        # Inicializar datos para los gráficos (se recogen aunque la pestaña no se haya abierto)
+        self.throughput_series = ChartSeries()
+        self.queue_series = QueueLengthSeries()
+        self.buffer_usage_series = ChartSeries()
+        self.device_status_data = {}
+        
+        # Los redibujados completos se solicitan con draw_idle y se agrupan en uno solo por lote
+        self.fig = None
+        self.canvas = None
+        self._draw_pending = False
+        self._draw_batch_depth = 0
+        
+        # Crear un marco para los gráficos con un aviso hasta que se construyan
+        self._charts_frame = ttk.Frame(parent)
+        self._charts_frame.pack(fill=tk.BOTH, expand=True)
+        self._charts_placeholder = ttk.Label(self._charts_frame, text="Cargando...")
+        self._charts_placeholder.pack(expand=True)
+        parent.bind("<Visibility>", self._lazy_build_charts)
+        self._monitoring_tab = parent
+    
+    def _lazy_build_charts(self, event=None):
+        """Importar Matplotlib y construir la figura de monitoreo la primera vez que se muestra la pestaña"""
+        if self.fig is not None:
+            return
+        self._monitoring_tab.unbind("<Visibility>")
+        self._charts_placeholder.destroy()
+        
+        # La figura se incrusta directamente en Tk: sin pyplot ni selección de backend global
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         
         # Crear una figura para los gráficos
-        self.fig = plt.Figure(figsize=(12, 8), dpi=100)
+        self.fig = Figure(figsize=(12, 8), dpi=self.chart_dpi_var.get())
         
         # Crear un lienzo para mostrar la figura
-        self.canvas = FigureCanvasTkAgg(self.fig, master=charts_frame)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self._charts_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Crear subgráficos
@@ -364,33 +768,55 @@ class IOSimulationGUI:
         self.buffer_ax = self.fig.add_subplot(223)
         self.device_status_ax = self.fig.add_subplot(224)
         
-        # Inicializar datos para los gráficos
-        self.throughput_data = {"time": [], "value": []}
-        self.queue_data = {"time": [], "devices": {}}
-        self.buffer_usage_data = {"time": [], "value": []}
-        self.device_status_data = {}
-        
-        # Configurar los gráficos
+        # Configurar los gráficos; el eje de tiempo es relativo al instante actual
         self.throughput_ax.set_title("Rendimiento (MB/s)")
         self.throughput_ax.set_xlabel("Tiempo (s)")
         self.throughput_ax.set_ylabel("MB/s")
-        self.throughput_line, = self.throughput_ax.plot([], [], 'b-')
+        self.throughput_ax.set_xlim(-CHART_WINDOW_S, 0)
+        self.throughput_ax.set_ylim(0, THROUGHPUT_YLIM_MB_S)
+        self.throughput_ax.set_autoscale_on(False)
+        self.throughput_line, = self.throughput_ax.plot([], [], 'b-', animated=True)
         
         self.queue_ax.set_title("Longitud de la Cola de Operaciones")
         self.queue_ax.set_xlabel("Tiempo (s)")
         self.queue_ax.set_ylabel("Operaciones")
+        self.queue_ax.set_xlim(-CHART_WINDOW_S, 0)
+        self.queue_ax.set_ylim(0, QUEUE_YLIM)
+        self.queue_ax.set_autoscale_on(False)
         
         self.buffer_ax.set_title("Uso del Búfer")
         self.buffer_ax.set_xlabel("Tiempo (s)")
         self.buffer_ax.set_ylabel("Uso (%)")
-        self.buffer_line, = self.buffer_ax.plot([], [], 'g-')
+        self.buffer_ax.set_xlim(-CHART_WINDOW_S, 0)
+        self.buffer_ax.set_ylim(0, 100)
+        self.buffer_ax.set_autoscale_on(False)
+        self.buffer_line, = self.buffer_ax.plot([], [], 'g-', animated=True)
         
         self.device_status_ax.set_title("Estado de los Dispositivos")
         self.device_status_ax.set_xlabel("Dispositivo")
         self.device_status_ax.set_ylabel("Estado")
+        self._queue_ylim = QUEUE_YLIM
         
-        # Ajustar diseño
+        # Las líneas animadas se actualizan con blitting sobre un fondo guardado tras cada dibujo completo
+        self._blit_artists = {
+            self.throughput_ax: [self.throughput_line],
+            self.queue_ax: [],
+            self.buffer_ax: [self.buffer_line]
+        }
+        self._queue_lines = {}  # Nombre del dispositivo -> Line2D, creadas bajo demanda
+        self._chart_backgrounds = None
+        self._chart_signature = None
+        self._status_devices = ()  # Dispositivos con barra en el gráfico de estado, en orden
+        self._status_bars = []
+        self._status_texts = []
+        self.canvas.mpl_connect("draw_event", self._on_chart_draw)
+        self.canvas.mpl_connect("resize_event", self._on_chart_resize)
+        
+        # Ajustar diseño una vez y pintar los datos ya recogidos; después solo se recalcula
+        # al redimensionar o cuando cambian las etiquetas de los ejes
+        self._layout_dirty = False
         self.fig.tight_layout()
+        self.update_charts_gui()
     
     def setup_statistics_tab(self, parent):
         """Configurar la pestaña de estadísticas"""
@@ -414,6 +840,8 @@ class IOSimulationGUI:
             "throughput": tk.StringVar(value="0 MB/s"),
             "runtime": tk.StringVar(value="0s")
         }
+        self._stats_cache = {key: var.get() for key, var in self.stats_vars.items()}  # Último texto mostrado
+        self._stats_raw = {}  # Último valor sin formatear de cada estadística
         
         row = 0
         for label, var in self.stats_vars.items():
@@ -444,6 +872,7 @@ class IOSimulationGUI:
         self.device_stats_tree.configure(yscroll=scrollbar.set)
         
         self.device_stats_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._device_stats_rows = {}  # iid -> valores mostrados
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def setup_log_tab(self, parent):
@@ -457,32 +886,55 @@ class IOSimulationGUI:
         
         # Agregar un manejador personalizado al logger
         class TextHandler(logging.Handler):
-            def __init__(self, text_widget, master):
+            def __init__(self, text_widget, wake):
                 super().__init__()
                 self.text_widget = text_widget
-                self.master = master
+                self.wake = wake  # Avisa al hilo principal; seguro desde cualquier hilo
+                self.q = SimpleQueue()
+                self._scheduled = False
             
             def emit(self, record):
-                msg = self.format(record)
-                
-                def append():
-                    try:
-                        self.text_widget.configure(state='normal')
-                        self.text_widget.insert(tk.END, msg + '\n')
-                        self.text_widget.configure(state='disabled')
-                        self.text_widget.yview(tk.END)
-                    except Exception:
-                        pass  # El widget podría estar destruido
+                # Puede ejecutarse en cualquier hilo: solo encolar y avisar, nunca tocar Tk
+                self.q.put(self.format(record))
                 
-                # Usar after_idle para evitar bloquear la GUI
+                # Programar un único vaciado para todos los mensajes acumulados
+                if not self._scheduled:
+                    self._scheduled = True
+                    self.wake("flush_log")
+            
+            def _flush(self):
+                # Se ejecuta en el hilo principal al atender la cola de actualizaciones
+                # Desmarcar antes de vaciar para que los mensajes que lleguen durante el vaciado programen otro
+                self._scheduled = False
+                lines = []
                 try:
-                    self.master.after_idle(append)
-                except Exception:
-                    pass  # El master podría estar destruido
+                    while len(lines) < LOG_FLUSH_BATCH:
+                        lines.append(self.q.get_nowait())
+                except Empty:
+                    pass
+                if not lines:
+                    return
+                
+                self.text_widget.configure(state='normal')
+                self.text_widget.insert(tk.END, '\n'.join(lines) + '\n')
+                
+                # Limitar el texto conservado descartando las líneas más antiguas; se recorta
+                # en bloques de LOG_TRIM_SLACK líneas para no borrar en cada vaciado
+                line_count = int(self.text_widget.index('end-1c').split('.')[0])
+                if line_count > LOG_MAX_LINES + LOG_TRIM_SLACK:
+                    self.text_widget.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
+                
+                self.text_widget.configure(state='disabled')
+                self.text_widget.yview(tk.END)
+                
+                # Quedan mensajes pendientes: continuar en la siguiente vuelta de la cola
+                if not self.q.empty() and not self._scheduled:
+                    self._scheduled = True
+                    self.wake("flush_log")
         
-        text_handler = TextHandler(self.log_text, self.master)
-        text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logger.addHandler(text_handler)
+        self._log_text_handler = TextHandler(self.log_text, self.post_update)
+        self._log_text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(self._log_text_handler)
         
         # Controles
         controls_frame = ttk.Frame(log_frame)
@@ -531,13 +983,15 @@ class IOSimulationGUI:
             self.driver_table.register_driver(keyboard_dcb.device_id, keyboard_driver)
             
             # Conectar los dispositivos - usar la cola para actualizar la interfaz
-            self.interrupt_table.trigger_interrupt("UNIDAD_USB_CONNECT")  # Revertido a CONNECT
-            self.interrupt_table.trigger_interrupt("DISCO_DURO_CONNECT")  # Revertido a CONNECT
-            self.interrupt_table.trigger_interrupt("TECLADO_CONNECT")  # Revertido a CONNECT
+            self.interrupt_table.trigger_many((
+                usb_driver.connect_event,
+                hdd_driver.connect_event,
+                keyboard_driver.connect_event
+            ))
             
             # Colocar actualizaciones de la interfaz en la cola
-            self.update_queue.put(("update_device_list", None))
-            self.update_queue.put(("update_operations_list", None))
+            self.post_update("update_device_list")
+            self.post_update("update_operations_list")
             
         except Exception as e:
             logger.error(f"Error al inicializar dispositivos predeterminados: {e}")
@@ -546,7 +1000,7 @@ class IOSimulationGUI:
         """Agregar un nuevo dispositivo de bloques a la simulación"""
         try:
             # Obtener el siguiente ID de dispositivo disponible
-            device_id = len(self.driver_table.get_all_drivers()) + 1
+            device_id = self.driver_table.alloc_device_id()
             
             # Crear un nuevo bloque de control de dispositivo
             dcb = DeviceControlBlock(
@@ -564,7 +1018,7 @@ class IOSimulationGUI:
             self.driver_table.register_driver(dcb.device_id, driver)
             
             # Conectar el dispositivo
-            self.interrupt_table.trigger_interrupt(f"{dcb.device_name.upper().replace(' ', '_')}_CONNECT")  # Revertido a CONNECT
+            self.interrupt_table.trigger_interrupt(driver.connect_event)  # Revertido a CONNECT
             
             # Actualizar la lista de dispositivos
             self.update_device_list()
@@ -578,7 +1032,7 @@ class IOSimulationGUI:
         """Agregar un nuevo dispositivo de caracteres a la simulación"""
         try:
             # Obtener el siguiente ID de dispositivo disponible
-            device_id = len(self.driver_table.get_all_drivers()) + 1
+            device_id = self.driver_table.alloc_device_id()
             
             # Crear un nuevo bloque de control de dispositivo
             dcb = DeviceControlBlock(
@@ -595,7 +1049,7 @@ class IOSimulationGUI:
             self.driver_table.register_driver(dcb.device_id, driver)
             
             # Conectar el dispositivo
-            self.interrupt_table.trigger_interrupt(f"{dcb.device_name.upper().replace(' ', '_')}_CONNECT")  # Revertido a CONNECT
+            self.interrupt_table.trigger_interrupt(driver.connect_event)  # Revertido a CONNECT
             
             # Actualizar la lista de dispositivos
             self.update_device_list()
@@ -624,7 +1078,7 @@ class IOSimulationGUI:
             
             # Desconectar el dispositivo
             device_name = driver.dcb.device_name
-            self.interrupt_table.trigger_interrupt(f"{device_name.upper().replace(' ', '_')}_DISCONNECT")  # Revertido a DISCONNECT
+            self.interrupt_table.trigger_interrupt(driver.disconnect_event)  # Revertido a DISCONNECT
             
             # Desregistrar el controlador
             self.driver_table.unregister_driver(device_id)
@@ -673,8 +1127,11 @@ class IOSimulationGUI:
                 return
             
             # Conectar el dispositivo
-            device_name = driver.dcb.device_name
-            self.interrupt_table.trigger_interrupt(f"{device_name.upper().replace(' ', '_')}_CONNECT")  # Revertido a CONNECT
+            self.interrupt_table.trigger_interrupt(driver.connect_event)  # Revertido a CONNECT
+            
+            # Las operaciones en cola para este dispositivo pueden procesarse ya
+            if self.io_manager:
+                self.io_manager.wake()
             
             # Actualizar la lista de dispositivos
             self.update_device_list()
@@ -699,8 +1156,7 @@ class IOSimulationGUI:
                 return
             
             # Desconectar el dispositivo
-            device_name = driver.dcb.device_name
-            self.interrupt_table.trigger_interrupt(f"{device_name.upper().replace(' ', '_')}_DISCONNECT")  # Revertido a DISCONNECT
+            self.interrupt_table.trigger_interrupt(driver.disconnect_event)  # Revertido a DISCONNECT
             
             # Actualizar la lista de dispositivos
             self.update_device_list()
@@ -725,8 +1181,7 @@ class IOSimulationGUI:
                 return
             
             # Activar un error
-            device_name = driver.dcb.device_name
-            self.interrupt_table.trigger_interrupt(f"{device_name.upper().replace(' ', '_')}_ERROR", 
+            self.interrupt_table.trigger_interrupt(driver.error_event,
                                                 error_code=random.randint(1, 100),
                                                 error_message="Error simulado")
             
@@ -749,11 +1204,7 @@ class IOSimulationGUI:
                 return
             
             # Encontrar el ID del dispositivo
-            device_id = None
-            for did, driver in self.driver_table.get_all_drivers().items():
-                if driver.dcb.device_name == device_name:
-                    device_id = did
-                    break
+            device_id = self._device_ids().get(device_name)
             
             if device_id is None:
                 messagebox.showerror("Error", f"No se encontró un dispositivo con el nombre {device_name}")
@@ -812,35 +1263,32 @@ class IOSimulationGUI:
                 messagebox.showwarning("Sin Dispositivos", "No se encontraron dispositivos conectados.")
                 return
             
-            # Generar operaciones aleatorias
-            num_operations = random.randint(5, 15)
-            
-            for _ in range(num_operations):
-                # Seleccionar un dispositivo aleatorio
-                device_id, driver = random.choice(connected_devices)
-                
-                # Generar parámetros aleatorios para la operación
-                operation_type = random.choice(list(OperationType))
-                data_size = random.uniform(1.0, 100.0)
-                process_name = f"Proceso{random.randint(1, 100)}"
-                priority = random.randint(0, 10)
-                
-                # Dirección de bloque para dispositivos de bloques
-                block_address = None
-                if driver.dcb.device_type == DeviceType.BLOQUE:  # Cambiado de BLOCK a BLOQUE
-                    block_address = random.randint(0, 1000000)
-                
-                # Crear la operación
-                operation = IOOperation(
-                    operation_type=operation_type,
-                    data_size_mb=data_size,
-                    process_name=process_name,
-                    priority=priority,
-                    block_address=block_address
-                )
-                
-                # Agregar a la cola
-                self.io_manager.add_io_operation(device_id, operation)
+            # Generar todos los parámetros aleatorios de una vez
+            rng = np.random.default_rng()
+            num_operations = int(rng.integers(5, 16))
+            device_indices = rng.integers(0, len(connected_devices), num_operations).tolist()
+            type_indices = rng.integers(0, len(OperationType), num_operations).tolist()
+            data_sizes = rng.uniform(1.0, 100.0, num_operations).tolist()
+            process_ids = rng.integers(1, 101, num_operations).tolist()
+            priorities = rng.integers(0, 11, num_operations).tolist()
+            block_addresses = rng.integers(0, 1000001, num_operations).tolist()
+            operation_types = list(OperationType)
+            
+            # Crear las operaciones; la dirección de bloque solo aplica a dispositivos de bloques
+            operations = []
+            for i in range(num_operations):
+                device_id, driver = connected_devices[device_indices[i]]
+                is_block = driver.dcb.device_type == DeviceType.BLOQUE  # Cambiado de BLOCK a BLOQUE
+                operations.append((device_id, IOOperation(
+                    operation_type=operation_types[type_indices[i]],
+                    data_size_mb=data_sizes[i],
+                    process_name=f"Proceso{process_ids[i]}",
+                    priority=priorities[i],
+                    block_address=block_addresses[i] if is_block else None
+                )))
+            
+            # Agregar todas a la cola de una sola vez
+            self.io_manager.add_io_operations(operations)
             
             # Actualizar la lista de operaciones
             self.update_operations_list()
@@ -863,55 +1311,140 @@ class IOSimulationGUI:
     # MÉTODOS DE ACTUALIZACIÓN DE LA INTERFAZ
     # =========================================================================
     
+    def _sync_tree(self, tree, cache, rows):
+        """Aplicar al Treeview solo las diferencias con las filas mostradas (rows: lista ordenada de (iid, valores))"""
+        # Eliminar las filas que ya no existen
+        current = {iid for iid, _ in rows}
+        stale = [iid for iid in cache if iid not in current]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del cache[iid]
+        
+        # Actualizar solo las filas que cambiaron y reunir las nuevas
+        new_rows = []
+        for index, (iid, values) in enumerate(rows):
+            cached = cache.get(iid)
+            if cached is values:
+                continue  # Misma fila precalculada: nada que comparar
+            if cached is None:
+                new_rows.append((index, iid, values))
+            elif cached != values:
+                tree.item(iid, values=values)
+            else:
+                continue
+            cache[iid] = values
+        
+        # Insertar las filas nuevas en su posición (en orden creciente, así los índices siguen siendo válidos)
+        if new_rows:
+            self._fast_insert(tree, new_rows)
+    
+    @staticmethod
+    def _fast_insert(tree, rows):
+        """Insertar filas (índice, iid, valores) llamando directamente al comando Tcl del Treeview"""
+        tk_call = tree.tk.call
+        w = tree._w
+        for index, iid, values in rows:
+            tk_call(w, "insert", "", index, "-id", iid, "-values", values)
+    
     def update_device_list(self):
         """Actualizar la lista de dispositivos en el Treeview"""
         try:
-            # Limpiar el Treeview
-            for item in self.device_tree.get_children():
-                self.device_tree.delete(item)
-            
-            # Agregar todos los dispositivos
-            for device_id, driver in self.driver_table.get_all_drivers().items():
+            # Obtener las filas de todos los dispositivos; cada fila se recalcula únicamente
+            # cuando cambia la versión del DCB (estado o contadores) o el controlador
+            drivers = self.driver_table.get_all_drivers()
+            cache = self._device_row_cache
+            rows = []
+            for device_id, driver in drivers.items():
                 dcb = driver.dcb
-                self.device_tree.insert("", "end", values=(
-                    dcb.device_id,
-                    dcb.device_name,
-                    dcb.device_type.name,
-                    dcb.status.name,
-                    dcb.capacity_gb,
-                    dcb.transfer_rate_mb_s
-                ))
+                cached = cache.get(device_id)
+                if cached is None or cached[0] is not driver or cached[1] != dcb.version:
+                    cached = cache[device_id] = (driver, dcb.version, (str(device_id), (
+                        dcb.device_id,
+                        dcb.device_name,
+                        dcb.device_type.name,
+                        dcb.status.name,
+                        f"{dcb.capacity_gb:.0f}",
+                        f"{dcb.transfer_rate_mb_s:.1f}"
+                    )))
+                rows.append(cached[2])
+            for device_id in [device_id for device_id in cache if device_id not in drivers]:
+                del cache[device_id]
+            self._sync_tree(self.device_tree, self._device_rows, rows)
                 
             # Actualizar el combo de dispositivos en el formulario de operación
             self.update_operation_device_combo()
         except Exception as e:
             logger.error(f"Error al actualizar la lista de dispositivos: {e}")
     
+    def _refresh_device_index(self):
+        """Reconstruir los índices nombre <-> device_id solo cuando cambia la tabla de controladores"""
+        drivers = self.driver_table.get_all_drivers()
+        if drivers is not self._devname_source:
+            self._devname_by_id = {device_id: driver.dcb.device_name for device_id, driver in drivers.items()}
+            self._id_by_devname = {name: device_id for device_id, name in self._devname_by_id.items()}
+            self._devname_source = drivers
+    
+    def _device_names(self):
+        """Obtener device_id -> nombre del dispositivo"""
+        self._refresh_device_index()
+        return self._devname_by_id
+    
+    def _device_ids(self):
+        """Obtener nombre del dispositivo -> device_id"""
+        self._refresh_device_index()
+        return self._id_by_devname
+    
+    def _new_history_records(self, history):
+        """Registros del historial posteriores al último insertado (como mucho OPERATIONS_LIST_MAX), del más reciente al más antiguo"""
+        records = []
+        for record in reversed(history):
+            if record is self._last_op_record or len(records) >= OPERATIONS_LIST_MAX:
+                break
+            records.append(record)
+        return records
+    
     def update_operations_list(self):
-        """Actualizar la lista de operaciones en el Treeview"""
+        """Agregar al Treeview las operaciones completadas desde la última actualización"""
         try:
-            # Limpiar el Treeview
-            for item in self.operations_tree.get_children():
-                self.operations_tree.delete(item)
+            if not self.io_manager:
+                return
             
-            # Agregar todas las operaciones del historial
-            if self.io_manager:
-                for op in self.io_manager.operation_history[-100:]:  # Mostrar solo las últimas 100 operaciones
-                    device_name = "Desconocido"
-                    for _, driver in self.driver_table.get_all_drivers().items():
-                        if driver.dcb.device_id == op["device_id"]:
-                            device_name = driver.dcb.device_name
-                            break
-                    
-                    self.operations_tree.insert("", "end", values=(
-                        op["operation_id"],
-                        device_name,
-                        op["operation_type"],
-                        f"{op['data_size_mb']:.2f}",
-                        op["process_name"],
-                        op["priority"],
-                        op["status"]
-                    ))
+            # Recorrer el historial desde el final hasta el último registro ya mostrado
+            history = self.io_manager.operation_history
+            try:
+                records = self._new_history_records(history)
+            except RuntimeError:
+                # El hilo de E/S agregó registros durante el recorrido: usar una copia
+                records = self._new_history_records(history.copy())
+            if not records:
+                return
+            self._last_op_record = records[0]
+            records.reverse()
+            
+            # Insertar las nuevas filas al final
+            names = self._device_names()
+            rows = []
+            end = len(self._op_iids)
+            for op in records:
+                iid = str(op.operation_id)
+                rows.append((end, iid, (
+                    op.operation_id,
+                    names.get(op.device_id, "Desconocido"),
+                    op.operation_type,
+                    f"{op.data_size_mb:.2f}",
+                    op.process_name,
+                    op.priority,
+                    op.status
+                )))
+                self._op_iids.append(iid)
+                end += 1
+            self._fast_insert(self.operations_tree, rows)
+            
+            # Descartar las filas más antiguas por encima del límite
+            excess = len(self._op_iids) - OPERATIONS_LIST_MAX
+            if excess > 0:
+                self.operations_tree.delete(*[self._op_iids.popleft() for _ in range(excess)])
         except Exception as e:
             logger.error(f"Error al actualizar la lista de operaciones: {e}")
     
@@ -919,14 +1452,15 @@ class IOSimulationGUI:
         """Actualizar el combo box de dispositivos en el formulario de operación"""
         try:
             # Obtener todos los nombres de dispositivos
-            device_names = []
-            for _, driver in self.driver_table.get_all_drivers().items():
-                device_names.append(driver.dcb.device_name)
+            device_names = tuple(self._device_ids())
+            if device_names == self._combo_values:
+                return  # Sin cambios: no reconstruir el desplegable ni tocar la selección
+            self._combo_values = device_names
             
-            # Actualizar el combo box
+            # Actualizar el combo box conservando la selección si sigue siendo válida
             self.op_device_combo["values"] = device_names
-            if device_names:
-                self.op_device_var.set(device_names[0])
+            if self.op_device_var.get() not in device_names:
+                self.op_device_var.set(device_names[0] if device_names else "")
         except Exception as e:
             logger.error(f"Error al actualizar el combo de dispositivos: {e}")
     
@@ -934,383 +1468,492 @@ class IOSimulationGUI:
         """Actualizar estadísticas y gráficos"""
         try:
             if not self.io_manager:
-                self.master.after(1000, self.update_stats)
                 return
-                
-            # Actualizar estadísticas generales
-            self.stats_vars["operations_processed"].set(str(self.io_manager.stats["operations_processed"]))
-            self.stats_vars["operations_succeeded"].set(str(self.io_manager.stats["operations_succeeded"]))
-            self.stats_vars["operations_failed"].set(str(self.io_manager.stats["operations_failed"]))
-            
-            success_rate = self.io_manager.get_success_rate()
-            self.stats_vars["success_rate"].set(f"{success_rate:.2f}%")
-            
-            self.stats_vars["total_data"].set(f"{self.io_manager.stats['total_data_mb']:.2f} MB")
             
-            throughput = self.io_manager.get_throughput()
-            self.stats_vars["throughput"].set(f"{throughput:.2f} MB/s")
-            
-            runtime = time.time() - self.io_manager.stats["start_time"]
-            self.stats_vars["runtime"].set(f"{runtime:.2f}s")
-            
-            # Actualizar estadísticas de dispositivos
-            self.update_device_statistics()
-            
-            # Actualizar gráficos - hacer esto en un hilo separado para evitar bloquear la GUI
-            threading.Thread(target=self.update_charts_thread, daemon=True).start()
-            
-            # Actualizar barra de estado
-            self.throughput_label.config(text=f"Rendimiento: {throughput:.2f} MB/s")
-            
-            # Programar la próxima actualización
-            self.master.after(1000, self.update_stats)
+            # Procesar primero las actualizaciones pendientes para pintar todo en un solo dibujo
+            self._drain_update_queue()
+            self._update_stats_values()
         except Exception as e:
             logger.error(f"Error al actualizar estadísticas: {e}")
-            # Intentar nuevamente más tarde
-            self.master.after(1000, self.update_stats)
+    
+    def _set_stat(self, key, value, fmt="{}"):
+        """Actualizar una variable de estadísticas; solo se formatea si el valor cambió y solo se fija si cambió el texto"""
+        if self._stats_raw.get(key) == value:
+            return self._stats_cache[key]
+        self._stats_raw[key] = value
+        text = fmt.format(value)
+        if self._stats_cache.get(key) != text:
+            self.stats_vars[key].set(text)
+            self._stats_cache[key] = text
+        return text
+    
+    def _update_stats_values(self):
+        """Actualizar los valores de las estadísticas y lanzar la actualización de los gráficos"""
+        # Actualizar estadísticas generales
+        self._set_stat("operations_processed", self.io_manager.operations_processed)
+        self._set_stat("operations_succeeded", self.io_manager.operations_succeeded)
+        self._set_stat("operations_failed", self.io_manager.operations_failed)
+        self._set_stat("success_rate", self.io_manager.get_success_rate(), "{:.2f}%")
+        self._set_stat("total_data", self.io_manager.total_data_mb, "{:.2f} MB")
+        
+        # El texto del rendimiento se reutiliza en la barra de estado
+        throughput_text = self._set_stat("throughput", self.io_manager.get_throughput(), "{:.2f} MB/s")
+        
+        self._set_stat("runtime", self.io_manager.get_runtime(), "{:.2f}s")
+        
+        # Actualizar estadísticas de dispositivos
+        self.update_device_statistics()
+        
+        # Actualizar gráficos solo tras suficientes operaciones nuevas o si el último dibujo es antiguo;
+        # el muestreo son unas pocas escrituras en NumPy, así que se hace aquí mismo en el hilo principal
+        processed = self.io_manager.operations_processed
+        t = time.monotonic()
+        self._last_ops_processed = processed
+        self._last_stats_ts = t
+        if (processed - self._last_chart_ops >= CHART_REDRAW_MIN_OPS
+                or t - self._last_redraw_ts >= CHART_REDRAW_MAX_AGE_S):
+            self._last_chart_ops = processed
+            self._last_redraw_ts = t
+            self._sample_chart_data()
+            if self._visible:
+                self.update_charts_gui()
+        
+        # Actualizar barra de estado solo si el valor cambió
+        if self._stats_cache.get("status_throughput") != throughput_text:
+            self._stats_cache["status_throughput"] = throughput_text
+            self.throughput_label.config(text=f"Rendimiento: {throughput_text}")
     
     def update_device_statistics(self):
         """Actualizar las estadísticas de dispositivos en el Treeview"""
         try:
-            # Limpiar el Treeview
-            for item in self.device_stats_tree.get_children():
-                self.device_stats_tree.delete(item)
-            
-            # Agregar todos los dispositivos
-            for device_id, driver in self.driver_table.get_all_drivers().items():
-                dcb = driver.dcb
-                
-                # Calcular tiempo activo
-                uptime = time.time() - dcb.creation_time
-                uptime_str = f"{uptime:.2f}s"
-                
-                # Calcular datos transferidos
-                data_mb = dcb.bytes_transferred / (1024 * 1024)
-                data_str = f"{data_mb:.2f} MB"
-                
-                self.device_stats_tree.insert("", "end", values=(
+            drivers = self.driver_table.get_all_drivers()
+            dcbs = [driver.dcb for driver in drivers.values()]
+            count = len(dcbs)
+            
+            # Calcular tiempo activo y datos transferidos de todos los dispositivos de una vez
+            now = time.time()
+            uptimes = now - np.fromiter((dcb.creation_time for dcb in dcbs), float, count)
+            data_mb = np.fromiter((dcb.bytes_transferred for dcb in dcbs), float, count) * (1.0 / (1024 * 1024))
+            uptime_strs = np.char.mod("%.2fs", uptimes).tolist()
+            data_strs = np.char.mod("%.2f MB", data_mb).tolist()
+            
+            # Calcular las filas de todos los dispositivos
+            rows = [
+                (str(device_id), (
                     dcb.device_name,
                     dcb.operations_completed,
                     data_str,
                     dcb.error_count,
                     uptime_str
                 ))
+                for device_id, dcb, data_str, uptime_str in zip(drivers, dcbs, data_strs, uptime_strs)
+            ]
+            self._sync_tree(self.device_stats_tree, self._device_stats_rows, rows)
         except Exception as e:
             logger.error(f"Error al actualizar estadísticas de dispositivos: {e}")
     
-    def update_charts_thread(self):
-        """Actualizar gráficos en un hilo separado para evitar bloquear la GUI"""
+    def _sample_chart_data(self):
+        """Agregar una muestra a las series de los gráficos (llamado desde el hilo principal)"""
         try:
             # Preparar los datos de los gráficos
-            current_time = time.time() - self.io_manager.stats["start_time"]
+            current_time = self.io_manager.get_runtime()
             
             # Actualizar datos del gráfico de rendimiento
-            throughput = self.io_manager.get_throughput()
-            self.throughput_data["time"].append(current_time)
-            self.throughput_data["value"].append(throughput)
-            
-            # Mantener solo los últimos 60 segundos de datos
-            if len(self.throughput_data["time"]) > 60:
-                self.throughput_data["time"] = self.throughput_data["time"][-60:]
-                self.throughput_data["value"] = self.throughput_data["value"][-60:]
-            
-            # Actualizar datos del gráfico de longitud de cola
-            self.queue_data["time"].append(current_time)
+            self.throughput_series.append(current_time, self.io_manager.get_throughput())
             
             # Obtener longitudes de cola para todos los dispositivos
-            for device_id, driver in self.driver_table.get_all_drivers().items():
-                device_name = driver.dcb.device_name
-                if device_name not in self.queue_data["devices"]:
-                    self.queue_data["devices"][device_name] = []
-                
-                queue_length = self.io_scheduler.get_queue_length(device_id)
-                self.queue_data["devices"][device_name].append(queue_length)
-                
-                # Mantener solo los últimos 60 segundos de datos
-                if len(self.queue_data["devices"][device_name]) > 60:
-                    self.queue_data["devices"][device_name] = self.queue_data["devices"][device_name][-60:]
-            
-            # Mantener solo los últimos 60 segundos de datos de tiempo
-            if len(self.queue_data["time"]) > 60:
-                self.queue_data["time"] = self.queue_data["time"][-60:]
+            self.queue_series.append(current_time, [
+                (device_id, driver.dcb.device_name, self.io_scheduler.get_queue_length(device_id))
+                for device_id, driver in self.driver_table.get_all_drivers().items()
+            ])
             
             # Actualizar datos del gráfico de uso del búfer
-            buffer_usage = self.buffer_manager.get_buffer_usage()
-            self.buffer_usage_data["time"].append(current_time)
-            self.buffer_usage_data["value"].append(buffer_usage)
-            
-            # Mantener solo los últimos 60 segundos de datos
-            if len(self.buffer_usage_data["time"]) > 60:
-                self.buffer_usage_data["time"] = self.buffer_usage_data["time"][-60:]
-                self.buffer_usage_data["value"] = self.buffer_usage_data["value"][-60:]
-            
-            # Programar la actualización real de los gráficos en el hilo principal
-            self.master.after_idle(self.update_charts_gui)
+            self.buffer_usage_series.append(current_time, self.buffer_manager.get_buffer_usage())
             
         except Exception as e:
-            logger.error(f"Error en update_charts_thread: {e}")
+            logger.error(f"Error al muestrear los datos de los gráficos: {e}")
+    
+    @contextmanager
+    def _batched_draw(self):
+        """Agrupar las modificaciones de los gráficos y emitir un único draw_idle al salir"""
+        self._draw_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._draw_batch_depth -= 1
+            if not self._draw_batch_depth and self._draw_pending and self.canvas is not None:
+                self.canvas.draw_idle()
+    
+    def _request_draw(self):
+        """Solicitar un redibujado completo del lienzo (se agrupa si hay un lote abierto)"""
+        if self.canvas is None:
+            return  # Los gráficos aún no se han construido
+        self._draw_pending = True
+        if not self._draw_batch_depth:
+            self.canvas.draw_idle()
+    
+    def _on_chart_draw(self, event):
+        """Guardar el fondo de los ejes animados tras un dibujo completo y pintar las líneas encima"""
+        self._draw_pending = False
+        self._chart_backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self._blit_artists}
+        for ax, lines in self._blit_artists.items():
+            for line in lines:
+                ax.draw_artist(line)
+    
+    def _on_chart_resize(self, event):
+        """Recalcular el diseño de la figura cuando cambia el tamaño del lienzo"""
+        self.fig.tight_layout()
+    
+    def _blit_charts(self):
+        """Redibujar solo las líneas animadas sobre el fondo guardado"""
+        if self._chart_backgrounds is None or self._draw_pending:
+            # Aún no hay fondo o hay un dibujo completo pendiente que pintará las líneas
+            self._request_draw()
+            return
+        for ax, lines in self._blit_artists.items():
+            self.canvas.restore_region(self._chart_backgrounds[ax])
+            for line in lines:
+                ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
     
     def update_charts_gui(self):
         """Actualizar los gráficos en la GUI (llamado desde el hilo principal)"""
+        if self.fig is None:
+            return  # Pestaña aún no mostrada: los datos siguen acumulándose en las series
         try:
-            # Actualizar gráfico de rendimiento
-            self.throughput_ax.clear()
-            self.throughput_ax.set_title("Rendimiento (MB/s)")
-            self.throughput_ax.set_xlabel("Tiempo (s)")
-            self.throughput_ax.set_ylabel("MB/s")
-            if self.throughput_data["time"]:  # Solo graficar si tenemos datos
-                self.throughput_ax.plot(self.throughput_data["time"], self.throughput_data["value"], 'b-')
-            
-            # Actualizar gráfico de longitud de cola
-            self.queue_ax.clear()
-            self.queue_ax.set_title("Longitud de la Cola de Operaciones")
-            self.queue_ax.set_xlabel("Tiempo (s)")
-            self.queue_ax.set_ylabel("Operaciones")
-            
-            for device_name, queue_lengths in self.queue_data["devices"].items():
-                # Solo graficar si tenemos datos y puntos de tiempo
-                if self.queue_data["time"] and queue_lengths:
-                    # Rellenar los datos si es necesario
-                    if len(queue_lengths) < len(self.queue_data["time"]):
-                        queue_lengths = [0] * (len(self.queue_data["time"]) - len(queue_lengths)) + queue_lengths
-                    elif len(queue_lengths) > len(self.queue_data["time"]):
-                        queue_lengths = queue_lengths[-len(self.queue_data["time"]):]
-                    
-                    self.queue_ax.plot(self.queue_data["time"], queue_lengths, label=device_name)
-            
-            if self.queue_data["devices"]:  # Solo agregar leyenda si tenemos dispositivos
-                self.queue_ax.legend()
-            
-            # Actualizar gráfico de uso del búfer
-            self.buffer_ax.clear()
-            self.buffer_ax.set_title("Uso del Búfer")
-            self.buffer_ax.set_xlabel("Tiempo (s)")
-            self.buffer_ax.set_ylabel("Uso (%)")
-            if self.buffer_usage_data["time"]:  # Solo graficar si tenemos datos
-                self.buffer_ax.plot(self.buffer_usage_data["time"], self.buffer_usage_data["value"], 'g-')
-            self.buffer_ax.set_ylim(0, 100)
-            
-            # Actualizar gráfico de estado de dispositivos
-            self.device_status_ax.clear()
-            self.device_status_ax.set_title("Estado de los Dispositivos")
-            
-            devices = []
-            statuses = []
-            colors = []
-            
-            for _, driver in self.driver_table.get_all_drivers().items():
-                devices.append(driver.dcb.device_name)
-                status = driver.dcb.status
-                statuses.append(status.name)
-                
-                # Establecer color según el estado
-                if status == DeviceStatus.CONECTADO:  # Cambiado de CONNECTED a CONECTADO
-                    colors.append('green')
-                elif status == DeviceStatus.OCUPADO:  # Cambiado de BUSY a OCUPADO
-                    colors.append('blue')
-                elif status == DeviceStatus.ERROR:  # Sin cambios
-                    colors.append('red')
-                elif status == DeviceStatus.DESCONECTADO:  # Cambiado de DISCONNECTED a DESCONECTADO
-                    colors.append('gray')
-                else:
-                    colors.append('orange')
-            
-            # Crear un gráfico de barras horizontal si tenemos dispositivos
-            if devices:
-                y_pos = np.arange(len(devices))
-                self.device_status_ax.barh(y_pos, [1] * len(devices), color=colors)
-                self.device_status_ax.set_yticks(y_pos)
-                self.device_status_ax.set_yticklabels(devices)
-                self.device_status_ax.set_xlabel("Estado")
-                
-                # Agregar etiquetas de estado
-                for i, status in enumerate(statuses):
-                    self.device_status_ax.text(0.5, i, status, ha='center', va='center', color='white')
-            
-            # Ajustar diseño
-            self.fig.tight_layout()
-            
-            # Redibujar el lienzo
-            self.canvas.draw_idle()
-            
+            with self._batched_draw():
+                self._update_charts()
         except Exception as e:
             logger.error(f"Error al actualizar gráficos en GUI: {e}")
     
+    def _update_charts(self):
+        """Actualizar los datos de los gráficos y solicitar el dibujo necesario"""
+        full_redraw = False
+        
+        # Gráficos de rendimiento y de uso del búfer: solo cambian los datos de las líneas
+        if self.throughput_series:
+            times, values = self.throughput_series.relative()
+            self.throughput_line.set_data(times, values)
+            
+            # Ampliar el eje Y solo cuando los datos se salen de él (requiere un dibujo completo)
+            peak = float(values.max())
+            if peak > self.throughput_ax.get_ylim()[1]:
+                self.throughput_ax.set_ylim(0, peak * 1.5)
+                self._layout_dirty = True  # Las etiquetas del eje pueden ensancharse
+                full_redraw = True
+        
+        if self.buffer_usage_series:
+            self.buffer_line.set_data(*self.buffer_usage_series.relative())
+        
+        if self.queue_series:
+            full_redraw |= self._update_queue_lines()
+        
+        # Gráfico de estado: se reconstruye solo si cambió algún dispositivo
+        drivers = self.driver_table.get_all_drivers()
+        signature = tuple((driver.dcb.device_name, driver.dcb.status) for driver in drivers.values())
+        if signature != self._chart_signature:
+            self._chart_signature = signature
+            self._redraw_status_chart(drivers)
+            full_redraw = True
+        
+        if full_redraw:
+            # Redibujar el lienzo (ajustando el diseño solo si cambió la geometría de los ejes);
+            # el evento de dibujo guarda el nuevo fondo
+            if self._layout_dirty:
+                self._layout_dirty = False
+                self.fig.tight_layout()
+            self._request_draw()
+        else:
+            self._blit_charts()
+    
+    def _update_queue_lines(self):
+        """Actualizar las líneas de longitud de cola; devuelve True si hace falta un dibujo completo"""
+        full_redraw = False
+        times, lengths = self.queue_series.relative()
+        for device_name, row in zip(self.queue_series.names, lengths):
+            line = self._queue_lines.get(device_name)
+            if line is None:
+                # Dispositivo nuevo: crear su línea una sola vez y rehacer la leyenda
+                line, = self.queue_ax.plot([], [], label=device_name, animated=True)
+                self._queue_lines[device_name] = line
+                self._blit_artists[self.queue_ax].append(line)
+                self.queue_ax.legend()
+                full_redraw = True
+            line.set_data(times, row)
+        
+        # El eje Y solo crece cuando una cola supera el límite actual
+        peak = float(lengths.max()) if lengths.size else 0
+        if peak > self._queue_ylim:
+            self._queue_ylim = peak * 1.5
+            self._layout_dirty = True
+            self.queue_ax.set_ylim(0, self._queue_ylim)
+            full_redraw = True
+        return full_redraw
+    
+    def _redraw_status_chart(self, drivers):
+        """Actualizar el gráfico de estado; solo se reconstruye si cambian los dispositivos"""
+        devices = []
+        statuses = []
+        colors = []
+        
+        for _, driver in drivers.items():
+            devices.append(driver.dcb.device_name)
+            status = driver.dcb.status
+            statuses.append(status.name)
+            colors.append(STATUS_COLORS.get(status, 'orange'))  # Color según el estado
+        
+        devices = tuple(devices)
+        if devices == self._status_devices:
+            # Mismos dispositivos: recolorear las barras y cambiar el texto existentes
+            for bar, text, color, status in zip(self._status_bars, self._status_texts, colors, statuses):
+                bar.set_facecolor(color)
+                text.set_text(status)
+            return
+        
+        # Dispositivos agregados o eliminados: reconstruir el gráfico (cambian las etiquetas del eje Y)
+        self._status_devices = devices
+        self._layout_dirty = True
+        self._status_bars = []
+        self._status_texts = []
+        self.device_status_ax.clear()
+        self.device_status_ax.set_title("Estado de los Dispositivos")
+        
+        # Crear un gráfico de barras horizontal si tenemos dispositivos
+        if devices:
+            y_pos = np.arange(len(devices))
+            self._status_bars = list(self.device_status_ax.barh(y_pos, [1] * len(devices), color=colors))
+            self.device_status_ax.set_yticks(y_pos)
+            self.device_status_ax.set_yticklabels(devices)
+            self.device_status_ax.set_xlabel("Estado")
+            
+            # Agregar etiquetas de estado
+            self._status_texts = [
+                self.device_status_ax.text(0.5, i, status, ha='center', va='center', color='white')
+                for i, status in enumerate(statuses)
+            ]
+    
     # =========================================================================
     # MÉTODOS DE COMANDOS DEL MENÚ
     # =========================================================================
     
+    @gui_action("Error al guardar configuración", show_error=True)
     def save_configuration(self):
         """Guardar la configuración actual en un archivo"""
-        try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
-            )
-            
-            if not file_path:
-                return
-            
-            # Crear un diccionario de configuración
-            config = {
-                "devices": [],
-                "scheduling_algorithm": self.io_scheduler.algorithm.name
-            }
-            
-            # Agregar todos los dispositivos
-            for device_id, driver in self.driver_table.get_all_drivers().items():
-                config["devices"].append(driver.dcb.to_dict())
-            
-            # Guardar en archivo
-            with open(file_path, 'w') as f:
-                json.dump(config, f, indent=4)
-            
-            logger.info(f"Configuración guardada en {file_path}")
-            messagebox.showinfo("Éxito", f"Configuración guardada en {file_path}")
-            
-        except Exception as e:
-            logger.error(f"Error al guardar configuración: {e}")
-            messagebox.showerror("Error", f"Error al guardar configuración: {e}")
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        # Crear un diccionario de configuración
+        config = {
+            "devices": [],
+            "scheduling_algorithm": self.io_scheduler.algorithm.name
+        }
+        
+        # Agregar todos los dispositivos
+        for device_id, driver in self.driver_table.get_all_drivers().items():
+            config["devices"].append(driver.dcb.to_dict())
+        
+        # Guardar en archivo desde un hilo de trabajo
+        self._write_file_async(file_path, lambda: (_dumps_json(config),),
+                               f"Configuración guardada en {file_path}",
+                               "Error al guardar configuración")
     
+    @gui_action("Error al cargar configuración", show_error=True)
     def load_configuration(self):
         """Cargar una configuración desde un archivo"""
-        try:
-            file_path = filedialog.askopenfilename(
-                filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
-            )
-            
-            if not file_path:
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        # Leer y decodificar el archivo en un hilo de trabajo; se aplica luego en el hilo principal
+        def worker():
+            try:
+                with open(file_path, 'rb') as f:
+                    config = _loads_json(f.read())
+            except Exception as e:
+                logger.error(f"Error al cargar configuración: {e}")
+                self.post_update("show_message", ("error", f"Error al cargar configuración: {e}"))
                 return
+            self.post_update("apply_configuration", (file_path, config))
+        
+        self._io_pool.submit(worker)
+    
+    @gui_action("Error al cargar configuración", show_error=True)
+    def _apply_configuration(self, file_path, config):
+        """Aplicar una configuración ya decodificada (llamado desde el hilo principal)"""
+        # Establecer el algoritmo de planificación
+        if "scheduling_algorithm" in config:
+            algorithm = SchedulingAlgorithm[config["scheduling_algorithm"]]
+            self.io_scheduler.set_algorithm(algorithm)
+            self.scheduling_var.set(config["scheduling_algorithm"])
+        
+        # Limpiar dispositivos existentes
+        for device_id in list(self.driver_table.get_all_drivers().keys()):
+            self.driver_table.unregister_driver(device_id)
+        
+        # Agregar todos los dispositivos
+        for device_data in config.get("devices", []):
+            # Crear un nuevo bloque de control de dispositivo
+            dcb = DeviceControlBlock(
+                device_id=device_data["device_id"],
+                device_name=device_data["device_name"],
+                device_type=DeviceType[device_data["device_type"]],
+                capacity_gb=device_data["capacity_gb"],
+                transfer_rate_mb_s=device_data["transfer_rate_mb_s"]
+            )
             
-            # Cargar la configuración
-            with open(file_path, 'r') as f:
-                config = json.load(f)
-            
-            # Establecer el algoritmo de planificación
-            if "scheduling_algorithm" in config:
-                algorithm = SchedulingAlgorithm[config["scheduling_algorithm"]]
-                self.io_scheduler.set_algorithm(algorithm)
-                self.scheduling_var.set(config["scheduling_algorithm"])
-            
-            # Limpiar dispositivos existentes
-            for device_id in list(self.driver_table.get_all_drivers().keys()):
-                self.driver_table.unregister_driver(device_id)
-            
-            # Agregar todos los dispositivos
-            for device_data in config.get("devices", []):
-                # Crear un nuevo bloque de control de dispositivo
-                dcb = DeviceControlBlock(
-                    device_id=device_data["device_id"],
-                    device_name=device_data["device_name"],
-                    device_type=DeviceType[device_data["device_type"]],
-                    capacity_gb=device_data["capacity_gb"],
-                    transfer_rate_mb_s=device_data["transfer_rate_mb_s"]
-                )
-                
-                # Crear un nuevo controlador
-                if dcb.device_type == DeviceType.BLOQUE:
-                    driver = BlockDeviceDriver(dcb, self.interrupt_table, self.buffer_manager)
-                else:
-                    driver = CharacterDeviceDriver(dcb, self.interrupt_table, self.buffer_manager)
-                
-                # Registrar el controlador
-                self.driver_table.register_driver(dcb.device_id, driver)
-                
-                # Conectar el dispositivo si estaba conectado
-                if device_data["status"] == "CONECTADO":  # Cambiado de CONNECTED a CONECTADO
-                    self.interrupt_table.trigger_interrupt(f"{dcb.device_name.upper().replace(' ', '_')}_CONNECT")  # Revertido a CONNECT
-            
-            # Actualizar la interfaz
-            self.update_device_list()
+            # Crear un nuevo controlador
+            if dcb.device_type == DeviceType.BLOQUE:
+                driver = BlockDeviceDriver(dcb, self.interrupt_table, self.buffer_manager)
+            else:
+                driver = CharacterDeviceDriver(dcb, self.interrupt_table, self.buffer_manager)
             
-            logger.info(f"Configuración cargada desde {file_path}")
-            messagebox.showinfo("Éxito", f"Configuración cargada desde {file_path}")
+            # Registrar el controlador
+            self.driver_table.register_driver(dcb.device_id, driver)
             
-        except Exception as e:
-            logger.error(f"Error al cargar configuración: {e}")
-            messagebox.showerror("Error", f"Error al cargar configuración: {e}")
+            # Conectar el dispositivo si estaba conectado
+            if device_data["status"] == "CONECTADO":  # Cambiado de CONNECTED a CONECTADO
+                self.interrupt_table.trigger_interrupt(driver.connect_event)  # Revertido a CONNECT
+        
+        # Actualizar la interfaz
+        self.update_device_list()
+        
+        logger.info(f"Configuración cargada desde {file_path}")
+        self._show_message("info", f"Configuración cargada desde {file_path}")
     
+    @gui_action("Error al exportar estadísticas", show_error=True)
     def export_statistics(self):
         """Exportar estadísticas a un archivo"""
-        try:
-            if not self.io_manager:
-                messagebox.showerror("Error", "Gestor de E/S no inicializado")
-                return
-                
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
-            )
-            
-            if not file_path:
+        if not self.io_manager:
+            messagebox.showerror("Error", "Gestor de E/S no inicializado")
+            return
+            
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Archivos JSON", "*.json"), ("Todos los archivos", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        # Crear un diccionario de estadísticas
+        stats = {
+            "overall": self.io_manager.stats,
+            "devices": [],
+            "operations": self.io_manager.get_operation_records()
+        }
+        
+        # Agregar todos los dispositivos, con sus estadísticas sobre el historial reciente
+        device_stats = self.io_manager.get_device_stats()
+        for device_id, driver in self.driver_table.get_all_drivers().items():
+            device = driver.dcb.to_dict()
+            device["recent_history"] = device_stats.get(device_id, {})
+            stats["devices"].append(device)
+        
+        # Guardar en archivo desde un hilo de trabajo
+        self._write_file_async(file_path, lambda: (_dumps_json(stats),),
+                               f"Estadísticas exportadas a {file_path}",
+                               "Error al exportar estadísticas")
+    
+    def _write_file_async(self, file_path, produce, success_message, error_message):
+        """Escribir en el hilo de E/S los bloques de bytes que devuelve produce() y notificar el resultado al hilo principal"""
+        def worker():
+            # Escribir en un archivo temporal y reemplazar el destino de forma atómica
+            tmp_path = file_path + ".part"
+            try:
+                with open(tmp_path, 'wb', buffering=FILE_WRITE_BUFFER_BYTES) as f:
+                    f.writelines(produce())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except Exception as e:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass  # El temporal no llegó a crearse
+                logger.error(f"{error_message}: {e}")
+                self.post_update("show_message", ("error", f"{error_message}: {e}"))
                 return
-            
-            # Crear un diccionario de estadísticas
-            stats = {
-                "overall": self.io_manager.stats,
-                "devices": [],
-                "operations": self.io_manager.operation_history
-            }
-            
-            # Agregar todos los dispositivos
-            for device_id, driver in self.driver_table.get_all_drivers().items():
-                stats["devices"].append(driver.dcb.to_dict())
-            
-            # Guardar en archivo
-            with open(file_path, 'w') as f:
-                json.dump(stats, f, indent=4)
-            
-            logger.info(f"Estadísticas exportadas a {file_path}")
-            messagebox.showinfo("Éxito", f"Estadísticas exportadas a {file_path}")
-            
-        except Exception as e:
-            logger.error(f"Error al exportar estadísticas: {e}")
-            messagebox.showerror("Error", f"Error al exportar estadísticas: {e}")
+            logger.info(success_message)
+            self.post_update("show_message", ("info", success_message))
+        
+        self._io_pool.submit(worker)
     
+    def _show_message(self, kind, message):
+        """Mostrar un mensaje de resultado: los errores en un diálogo, los éxitos en la barra de estado"""
+        if kind == "error":
+            messagebox.showerror("Error", message)
+            return
+        self.status_label.config(text=message)
+        if self._status_reset_id is not None:
+            self.master.after_cancel(self._status_reset_id)
+        self._status_reset_id = self.master.after(STATUS_MESSAGE_MS, self._reset_status_message)
+    
+    def _reset_status_message(self):
+        """Restablecer el texto de la barra de estado"""
+        self._status_reset_id = None
+        self.status_label.config(text="Listo")
+    
+    @gui_action("Error al limpiar registro")
     def clear_log(self):
         """Limpiar el texto del registro"""
-        try:
-            self.log_text.configure(state='normal')
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.configure(state='disabled')
-        except Exception as e:
-            logger.error(f"Error al limpiar registro: {e}")
+        self.log_text.configure(state='normal')
+        self.log_text.delete(1.0, tk.END)
+        self.log_text.configure(state='disabled')
     
+    @gui_action("Error al guardar registro", show_error=True)
     def save_log(self):
         """Guardar el registro en un archivo"""
-        try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".log",
-                filetypes=[("Archivos de Registro", "*.log"), ("Archivos de Texto", "*.txt"), ("Todos los archivos", "*.*")]
-            )
-            
-            if not file_path:
-                return
-            
-            # Obtener el texto del registro
-            log_text = self.log_text.get(1.0, tk.END)
-            
-            # Guardar en archivo
-            with open(file_path, 'w') as f:
-                f.write(log_text)
-            
-            logger.info(f"Registro guardado en {file_path}")
-            messagebox.showinfo("Éxito", f"Registro guardado en {file_path}")
-            
-        except Exception as e:
-            logger.error(f"Error al guardar registro: {e}")
-            messagebox.showerror("Error", f"Error al guardar registro: {e}")
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".log",
+            filetypes=[("Archivos de Registro", "*.log"), ("Archivos de Texto", "*.txt"), ("Todos los archivos", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        # Copiar el registro por bloques de líneas en el hilo principal (Tk no es seguro entre hilos)
+        last_line = int(self.log_text.index('end-1c').split('.')[0])
+        chunks = [
+            self.log_text.get(f"{line}.0", f"{line + LOG_SAVE_CHUNK_LINES}.0").encode('utf-8')
+            for line in range(1, last_line + 1, LOG_SAVE_CHUNK_LINES)
+        ]
+        
+        # Escribir el archivo en el hilo de E/S
+        self._write_file_async(file_path, lambda: chunks,
+                               f"Registro guardado en {file_path}",
+                               "Error al guardar registro")
     
+    @gui_action("Error al cambiar algoritmo de planificación")
     def change_scheduling_algorithm(self):
         """Cambiar el algoritmo de planificación"""
-        try:
-            algorithm_name = self.scheduling_var.get()
-            algorithm = SchedulingAlgorithm[algorithm_name]
-            self.io_scheduler.set_algorithm(algorithm)
-            
-            logger.info(f"Algoritmo de planificación cambiado a {algorithm_name}")
-        except Exception as e:
-            logger.error(f"Error al cambiar algoritmo de planificación: {e}")
+        algorithm, message = self._alg_cache[self.scheduling_var.get()]
+        self.io_scheduler.set_algorithm(algorithm)
+        
+        logger.info(message)
+    
+    @gui_action("Error al cambiar la resolución de los gráficos")
+    def change_chart_dpi(self):
+        """Cambiar la resolución de la figura de monitoreo conservando su tamaño en pantalla"""
+        dpi = self.chart_dpi_var.get()
+        if self.fig is None:
+            return  # Se aplicará al construir los gráficos
+        width, height = self.fig.get_size_inches() * self.fig.dpi
+        self.fig.set_dpi(dpi)
+        self.fig.set_size_inches(width / dpi, height / dpi, forward=False)
+        
+        # Un dibujo completo recalcula el diseño y guarda los nuevos fondos
+        self.fig.tight_layout()
+        self._request_draw()
+        
+        logger.info(f"Resolución de los gráficos cambiada a {dpi} DPI")
     
     def show_documentation(self):
         """Mostrar la documentación"""
@@ -1331,14 +1974,34 @@ class IOSimulationGUI:
     
     def exit_application(self):
         """Salir de la aplicación"""
+        if self._shutting_down:
+            return  # Ya hay una salida en curso (p. ej. diálogo abierto)
+        self._shutting_down = True
         try:
-            if messagebox.askyesno("Salir", "¿Está seguro de que desea salir?"):
-                # Detener el Gestor de E/S
-                if self.io_manager:
-                    self.io_manager.stop()
-                
-                # Cerrar la aplicación
-                self.master.destroy()
+            if not messagebox.askyesno("Salir", "¿Está seguro de que desea salir?"):
+                self._shutting_down = False
+                return
+            # Dejar de enviar registros al widget antes de esperar a otros hilos: mientras este
+            # hilo espera nadie vacía la cola del manejador, y después el widget se destruye
+            logger.removeHandler(self._log_text_handler)
+            
+            # Detener el Gestor de E/S esperando como mucho EXIT_JOIN_TIMEOUT_S a su hilo
+            if self.io_manager:
+                self.io_manager.stop()
+                if self.io_manager.is_alive():
+                    self.io_manager.join(timeout=EXIT_JOIN_TIMEOUT_S)
+            self._close_update_channel()
+            
+            # Dejar terminar las escrituras de archivos en curso (el hilo de E/S atiende las tareas en orden)
+            io_done = self._io_pool.submit(lambda: None)
+            self._io_pool.shutdown(wait=False)
+            wait([io_done], timeout=EXIT_JOIN_TIMEOUT_S)
+            
+            # Vaciar los registros pendientes al archivo antes de cerrar
+            stop_log_listener()
+            
+            # Cerrar la aplicación
+            self.master.destroy()
         except Exception as e:
             logger.error(f"Error al salir de la aplicación: {e}")
             # Forzar salida